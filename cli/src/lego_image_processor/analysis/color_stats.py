@@ -51,15 +51,21 @@ def analyze_image(
     if image.mode != "RGB":
         image = image.convert("RGB")
 
-    # Get pixel data
-    img_array = np.array(image)
-    pixels = img_array.reshape(-1, 3)
+    # Solid-color fast path: PIL counts in C and returns None past one color
+    solid = image.getcolors(maxcolors=1)
+    if solid:
+        count, rgb = solid[0]
+        color_counts = Counter({tuple(rgb): count})
+        total_pixels = count
+    else:
+        # Get pixel data as plain int tuples, matching the keys getcolors gives
+        img_array = np.array(image)
+        pixels = img_array.reshape(-1, 3).tolist()
+
+        # Count colors
+        color_counts = Counter(map(tuple, pixels))
+        total_pixels = len(pixels)
 
-    # Count colors
-    color_tuples = [tuple(p) for p in pixels]
-    color_counts = Counter(color_tuples)
-
-    total_pixels = len(color_tuples)
     unique_colors = len(color_counts)
 
     # Check LEGO colors
@@ -3,13 +3,56 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Callable, Optional
 
 import click
+from PIL import Image
 
 from ..core.image_loader import load_image, ImageLoadError
 from ..palette.loader import LegoPalette
-from ..layout.land_sea_mask import load_land_sea_mask
+from ..layout.land_sea_mask import LandSeaMask, load_land_sea_mask
 from ..layout.generator import LayoutGenerator
+from ..layout.grid import PositionPlacementGrid
+
+
+def run_layout(
+    image: Image.Image,
+    output: str,
+    output_format: str,
+    palette: LegoPalette,
+    land_sea_mask: LandSeaMask,
+    source_filename: str,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> PositionPlacementGrid:
+    """Generate a layout from a loaded image and write it to disk.
+
+    Args:
+        image: Quantized 128x80 image
+        output: Output file path
+        output_format: "json" or "csv"
+        palette: LEGO color palette
+        land_sea_mask: Land/sea mask
+        source_filename: Name recorded as the layout's source image
+        progress_callback: Optional callback(current, total) for progress
+
+    Returns:
+        The generated PositionPlacementGrid
+    """
+    generator = LayoutGenerator(palette=palette, land_sea_mask=land_sea_mask)
+    grid = generator.generate(
+        image,
+        source_filename=source_filename,
+        progress_callback=progress_callback
+    )
+
+    if output_format == "json":
+        content = grid.to_json()
+    else:
+        content = grid.to_csv()
+
+    Path(output).write_text(content, encoding="utf-8")
+
+    return grid
 
 
 @click.command()
@@ -89,10 +132,9 @@ def layout(input_image: str, output: str, output_format: str, quiet: bool) -> No
                       f"{land_sea_mask.ocean_count:,} ocean positions")
             click.echo()
 
-        # Create generator
-        generator = LayoutGenerator(palette=palette, land_sea_mask=land_sea_mask)
-
         # Generate layout with progress
+        source_filename = Path(input_image).name
+
         if not quiet:
             click.echo("Generating position placements...")
             with click.progressbar(
@@ -103,27 +145,16 @@ def layout(input_image: str, output: str, output_format: str, quiet: bool) -> No
                 def progress_callback(current: int, total: int) -> None:
                     bar.update(1)
 
-                grid = generator.generate(
-                    image,
-                    source_filename=Path(input_image).name,
-                    progress_callback=progress_callback
+                grid = run_layout(
+                    image, output, output_format, palette, land_sea_mask,
+                    source_filename, progress_callback=progress_callback
                 )
         else:
-            grid = generator.generate(
-                image,
-                source_filename=Path(input_image).name
+            grid = run_layout(
+                image, output, output_format, palette, land_sea_mask,
+                source_filename
             )
 
-        # Write output
-        output_path = Path(output)
-
-        if output_format == "json":
-            content = grid.to_json()
-        else:
-            content = grid.to_csv()
-
-        output_path.write_text(content, encoding="utf-8")
-
         # Print summary
         if not quiet:
             click.echo()
@@ -4,13 +4,66 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Optional
 
 import click
 
 from ..palette.loader import LegoPalette
 from ..layout.grid import PositionPlacementGrid
-from ..layout.kit_spec import load_kit_specification
-from ..layout.validator import LayoutValidator
+from ..layout.kit_spec import LEGOWorldMapKitSpecification, load_kit_specification
+from ..layout.validator import LayoutValidator, ValidationReport
+
+
+def load_layout(layout_file: str) -> PositionPlacementGrid:
+    """Load a layout from a JSON file.
+
+    Args:
+        layout_file: Path to the layout JSON file
+
+    Returns:
+        The loaded PositionPlacementGrid
+
+    Raises:
+        click.ClickException: If the file is not JSON
+    """
+    layout_path = Path(layout_file)
+
+    if layout_path.suffix.lower() != ".json":
+        raise click.ClickException(
+            f"Unsupported layout format: {layout_path.suffix}. Use JSON format."
+        )
+
+    with open(layout_path, "r", encoding="utf-8") as f:
+        layout_data = f.read()
+    return PositionPlacementGrid.from_json(layout_data)
+
+
+def run_validate(
+    layout: PositionPlacementGrid,
+    kit_spec: LEGOWorldMapKitSpecification,
+    palette: LegoPalette,
+    layout_file: str,
+    output: Optional[str] = None
+) -> ValidationReport:
+    """Validate a layout and optionally write the report to disk.
+
+    Args:
+        layout: Layout to validate
+        kit_spec: Kit specification to validate against
+        palette: LEGO color palette
+        layout_file: Layout path recorded in the report
+        output: Optional output path for the JSON report
+
+    Returns:
+        The ValidationReport
+    """
+    validator = LayoutValidator(kit_spec=kit_spec, palette=palette)
+    report = validator.validate(layout, layout_file=layout_file)
+
+    if output:
+        Path(output).write_text(report.to_json(), encoding="utf-8")
+
+    return report
 
 
 @click.command()
@@ -52,17 +105,8 @@ def validate(layout_file: str, kit: str, output: str) -> None:
     """
     try:
         # Load layout
-        layout_path = Path(layout_file)
         click.echo(f"Loading layout: {layout_file}")
-
-        if layout_path.suffix.lower() == ".json":
-            with open(layout_path, "r", encoding="utf-8") as f:
-                layout_data = f.read()
-            layout = PositionPlacementGrid.from_json(layout_data)
-        else:
-            raise click.ClickException(
-                f"Unsupported layout format: {layout_path.suffix}. Use JSON format."
-            )
+        layout = load_layout(layout_file)
 
         click.echo(f"  Total positions: {layout.total_positions:,}")
         click.echo(f"  Land bricks: {layout.land_positions:,}")
@@ -83,8 +127,7 @@ def validate(layout_file: str, kit: str, output: str) -> None:
 
         # Validate
         click.echo("Validating layout against kit...")
-        validator = LayoutValidator(kit_spec=kit_spec, palette=palette)
-        report = validator.validate(layout, layout_file=layout_file)
+        report = run_validate(layout, kit_spec, palette, layout_file, output=output)
 
         # Summarize violations
         color_unavailable = [v for v in report.violations if v.type == "color_unavailable"]
@@ -122,11 +165,6 @@ def validate(layout_file: str, kit: str, output: str) -> None:
 
         click.echo()
 
-        # Write report if requested
-        if output:
-            output_path = Path(output)
-            output_path.write_text(report.to_json(), encoding="utf-8")
-
         # Show summary
         click.echo(click.style("Validation complete!", fg="green" if report.buildable else "yellow"))
         click.echo(f"  Buildability: {report.buildability_score * 100:.1f}% "
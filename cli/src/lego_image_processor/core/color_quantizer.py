@@ -150,9 +150,8 @@ class ColorQuantizer:
 
     def _precompute_palette_lab(self) -> None:
         """Precompute LAB values for palette colors."""
-        rgb_array = np.array([c.rgb for c in self.palette.colors], dtype=np.float64)
-        self._palette_lab = rgb_to_lab(rgb_array)
-        self._palette_rgb = rgb_array.astype(np.uint8)
+        self._palette_rgb = self.palette.rgb_array
+        self._palette_lab = rgb_to_lab(self._palette_rgb)
 
     def find_closest_color(self, rgb: Tuple[int, int, int]) -> LegoColor:
         """Find the closest LEGO color to the given RGB value.
@@ -205,7 +204,7 @@ class ColorQuantizer:
         )
 
         # Convert unique colors to LAB
-        unique_lab = rgb_to_lab(unique_colors.astype(np.float64))
+        unique_lab = rgb_to_lab(unique_colors)
 
         # Find closest palette color for each unique color
         closest_indices = np.zeros(len(unique_colors), dtype=np.int32)
@@ -13,19 +13,46 @@ class ImageWriteError(Exception):
     pass
 
 
+def _flatten_rgba(image: Image.Image) -> Image.Image:
+    """Convert an RGBA image to RGB for formats without alpha.
+
+    Fully opaque images are converted directly; otherwise the image is
+    composited onto white so transparent areas don't keep their hidden color.
+
+    Args:
+        image: RGBA image
+
+    Returns:
+        RGB image
+    """
+    alpha_min, _ = image.getextrema()[3]
+    if alpha_min == 255:
+        return image.convert("RGB")
+    flattened = Image.new("RGB", image.size, (255, 255, 255))
+    flattened.paste(image, mask=image.getchannel("A"))
+    return flattened
+
+
 def save_image(
     image: Image.Image,
     path: Union[str, Path],
     format: str | None = None,
-    quality: int = 95
+    quality: int = 95,
+    compress_level: int = 6,
+    fast: bool = False
 ) -> None:
     """Save an image to a file.
 
+    JPEGs are written optimized and progressive. Passing fast=True skips the
+    extra encoder passes and uses PNG compression level 1, for preview output.
+
     Args:
         image: PIL Image to save
         path: Output file path
         format: Image format (inferred from extension if None)
         quality: JPEG quality (1-95, default 95)
+        compress_level: PNG zlib compression level (0-9, default 6)
+        fast: Favor encoding speed over output size
 
     Raises:
         ImageWriteError: If the image cannot be saved
@@ -48,11 +75,13 @@ def save_image(
         save_kwargs = {}
         if format == "JPEG":
             save_kwargs["quality"] = quality
+            save_kwargs["optimize"] = not fast
+            save_kwargs["progressive"] = not fast
             # Convert RGBA to RGB for JPEG
             if image.mode == "RGBA":
-                image = image.convert("RGB")
+                image = _flatten_rgba(image)
         elif format == "PNG":
-            save_kwargs["compress_level"] = 6
+            save_kwargs["compress_level"] = 1 if fast else compress_level
 
         image.save(path, format=format, **save_kwargs)
 
@@ -75,11 +104,10 @@ def get_output_path(
     Returns:
         Output file path
     """
-    input_path = Path(input_path)
-
     if output:
         return Path(output)
 
     # Add suffix before extension
+    input_path = Path(input_path)
     stem = input_path.stem + suffix
     return input_path.parent / f"{stem}{input_path.suffix}"
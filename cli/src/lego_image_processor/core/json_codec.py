@@ -0,0 +1,61 @@
+"""JSON encoding and decoding with optional orjson acceleration."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+
+def dumps(data: Any, indent: Optional[int] = 2) -> str:
+    """Serialize data to a JSON string.
+
+    Uses orjson when it is installed and the requested indentation is one it
+    supports (None or 2); otherwise falls back to the standard library. The
+    fallback is configured to match orjson: non-ASCII text is written as-is
+    rather than as \\u escapes, and compact output has no spaces after
+    separators.
+
+    Both paths produce equivalent JSON, but not always the same bytes: floats
+    that need an exponent are spelled differently (orjson writes 0.00001 and
+    1e16 where the standard library writes 1e-05 and 1e+16). Dict keys must
+    be str and values plain Python types, since orjson rejects other key
+    types and NumPy scalars.
+
+    Args:
+        data: JSON-serializable data (plain Python types, str keys only)
+        indent: Indentation level, or None for compact output
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        if indent == 2:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        if indent is None:
+            return orjson.dumps(data).decode("utf-8")
+    if indent is None:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(data, indent=indent, ensure_ascii=False)
+
+
+def loads(text: str | bytes) -> Any:
+    """Parse a JSON string.
+
+    Args:
+        text: JSON document as str or bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(text)
+    return json.loads(text)
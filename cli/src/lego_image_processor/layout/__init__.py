@@ -1,9 +1,10 @@
 """LEGO World Map layout generation module."""
 
-from .position import PositionPlacement
+from .position import PositionPlacement, PositionPlacementArray
 
 __all__ = [
     "PositionPlacement",
+    "PositionPlacementArray",
 ]
 
 # Lazy imports to avoid circular dependencies
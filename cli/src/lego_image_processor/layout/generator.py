@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple, Optional, Callable
+from typing import Optional, Callable
 
+import numpy as np
 from PIL import Image
 
-from .position import PositionPlacement
+from .position import PositionPlacementArray
 from .grid import PositionPlacementGrid
 from .land_sea_mask import LandSeaMask
-from ..palette.loader import LegoPalette, LegoColor
+from ..palette.loader import LegoPalette
 
 
 class LayoutGenerator:
@@ -38,10 +39,10 @@ class LayoutGenerator:
         self._palette = palette
         self._land_sea_mask = land_sea_mask
 
-        # Build RGB to color lookup for fast validation
-        self._rgb_to_color: Dict[Tuple[int, int, int], LegoColor] = {}
-        for color in palette.colors:
-            self._rgb_to_color[color.rgb] = color
+        # Palette colors packed as (r << 16) | (g << 8) | b for vectorized checks
+        self._palette_packed = np.array(
+            [color.rgb_packed for color in palette.colors], dtype=np.uint32
+        )
 
     def generate(
         self,
@@ -64,52 +65,41 @@ class LayoutGenerator:
         """
         # Validate image
         self._validate_dimensions(image)
-        self._validate_colors(image)
 
         # Convert image to RGB if needed
         if image.mode != "RGB":
             image = image.convert("RGB")
 
-        # Generate positions
+        # Pack pixels once; the same array serves validation and color lookup
+        packed = self._pack_rgb(np.asarray(image, dtype=np.uint32))
+        self._validate_colors(image, packed)
+
+        # Map each distinct pixel color to a palette entry, then build all
+        # positions from the land/sea mask and color indices at once
+        unique_packed, color_idx = np.unique(packed, return_inverse=True)
+        color_table = []
+        for value in unique_packed.tolist():
+            rgb = ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+            color = self._palette.get_by_rgb(rgb)
+            if color is None:
+                # This shouldn't happen after validation, but handle it
+                raise ValueError(f"Color lookup failed: RGB{rgb}")
+            color_table.append((self._make_color_id(color.name), color.name, str(color.id)))
+
+        placements = PositionPlacementArray.from_mask_and_colors(
+            self._land_sea_mask.as_array(),
+            color_idx.reshape(packed.shape),
+            color_table
+        )
+
         positions = []
-        total = self.EXPECTED_WIDTH * self.EXPECTED_HEIGHT
-
-        for y in range(self.EXPECTED_HEIGHT):
-            for x in range(self.EXPECTED_WIDTH):
-                # Get pixel color
-                rgb = image.getpixel((x, y))
-                if isinstance(rgb, int):  # Grayscale
-                    rgb = (rgb, rgb, rgb)
-
-                # Look up LEGO color
-                color = self._rgb_to_color.get(tuple(rgb))
-                if color is None:
-                    # This shouldn't happen after validation, but handle it
-                    raise ValueError(
-                        f"Color lookup failed at ({x}, {y}): RGB{rgb}"
-                    )
-
-                # Get part type from land/sea mask
-                is_land = self._land_sea_mask.is_land(x, y)
-                part_type = "brick" if is_land else "tile"
-                lego_part_id = "3062b" if is_land else "98138"
-
-                # Create position placement
-                position = PositionPlacement(
-                    x=x,
-                    y=y,
-                    color_id=self._make_color_id(color.name),
-                    color_name=color.name,
-                    lego_color_code=str(color.id),
-                    part_type=part_type,
-                    lego_part_id=lego_part_id
-                )
-                positions.append(position)
-
-                # Report progress
-                if progress_callback:
-                    current = y * self.EXPECTED_WIDTH + x + 1
-                    progress_callback(current, total)
+        total = len(placements)
+        for current, position in enumerate(placements.iter_placements(), start=1):
+            positions.append(position)
+
+            # Report progress
+            if progress_callback:
+                progress_callback(current, total)
 
         # Create grid
         return PositionPlacementGrid(
@@ -140,11 +130,12 @@ class LayoutGenerator:
                 f"    --target-height {self.EXPECTED_HEIGHT}"
             )
 
-    def _validate_colors(self, image: Image.Image) -> None:
+    def _validate_colors(self, image: Image.Image, packed: Optional[np.ndarray] = None) -> None:
         """Validate all pixels have valid LEGO palette colors.
 
         Args:
             image: Image to validate
+            packed: Pixels of the RGB image already packed by _pack_rgb, if available
 
         Raises:
             ValueError: If any pixel has a non-LEGO color
@@ -155,28 +146,40 @@ class LayoutGenerator:
         else:
             check_image = image
 
-        for y in range(image.height):
-            for x in range(image.width):
-                rgb = check_image.getpixel((x, y))
-                if isinstance(rgb, int):  # Grayscale
-                    rgb = (rgb, rgb, rgb)
-
-                if tuple(rgb) not in self._rgb_to_color:
-                    raise ValueError(
-                        f"Invalid color at pixel ({x}, {y})\n"
-                        f"RGB value: {rgb}\n"
-                        f"This color is not in the LEGO palette reference data.\n\n"
-                        f"Possible causes:\n"
-                        f"  1. Image was not quantized using lego-image-processor quantize command\n"
-                        f"  2. Image file was modified after quantization\n"
-                        f"  3. Image uses a custom color palette\n\n"
-                        f"Solution:\n"
-                        f"  Re-run quantization to convert all colors to LEGO palette:\n\n"
-                        f"  lego-image-processor quantize input.png \\\n"
-                        f"    --output quantized.png \\\n"
-                        f"    --target-width 128 \\\n"
-                        f"    --target-height 80"
-                    )
+        if packed is None:
+            packed = self._pack_rgb(np.asarray(check_image, dtype=np.uint32))
+        invalid = ~np.isin(packed, self._palette_packed)
+
+        if invalid.any():
+            y, x = (int(v) for v in np.argwhere(invalid)[0])
+            rgb = check_image.getpixel((x, y))
+            raise ValueError(
+                f"Invalid color at pixel ({x}, {y})\n"
+                f"RGB value: {rgb}\n"
+                f"This color is not in the LEGO palette reference data.\n\n"
+                f"Possible causes:\n"
+                f"  1. Image was not quantized using lego-image-processor quantize command\n"
+                f"  2. Image file was modified after quantization\n"
+                f"  3. Image uses a custom color palette\n\n"
+                f"Solution:\n"
+                f"  Re-run quantization to convert all colors to LEGO palette:\n\n"
+                f"  lego-image-processor quantize input.png \\\n"
+                f"    --output quantized.png \\\n"
+                f"    --target-width 128 \\\n"
+                f"    --target-height 80"
+            )
+
+    @staticmethod
+    def _pack_rgb(rgb: np.ndarray) -> np.ndarray:
+        """Pack RGB triples along the last axis into (r << 16) | (g << 8) | b.
+
+        Args:
+            rgb: uint32 array with a trailing axis of length 3
+
+        Returns:
+            uint32 array with the trailing axis removed
+        """
+        return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
 
     @staticmethod
     def _make_color_id(color_name: str) -> str:
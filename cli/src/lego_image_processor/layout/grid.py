@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import csv
-import json
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from io import StringIO
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
+import numpy as np
+from numpy.typing import NDArray
+
+from ..core import json_codec
 from .position import PositionPlacement
 
 
@@ -114,6 +117,9 @@ class PositionPlacementGrid:
         for pos in self._positions:
             self._position_map[(pos.x, pos.y)] = pos
 
+        # Column arrays are built lazily by as_soa
+        self._soa: Optional[Tuple[NDArray, NDArray, NDArray, NDArray]] = None
+
         # Compute derived values
         self._compute_counts()
 
@@ -178,6 +184,47 @@ class PositionPlacementGrid:
         """List of all position placements (copy)."""
         return list(self._positions)
 
+    @property
+    def as_soa(self) -> Tuple[NDArray[np.int16], NDArray[np.int16], NDArray[np.str_], NDArray[np.str_]]:
+        """Positions as parallel column arrays (structure of arrays).
+
+        Built once on first access and reused until the grid changes, so bulk
+        queries can use NumPy comparisons instead of per-position attribute access.
+
+        Returns:
+            Tuple of (x, y, part_type, lego_part_id) arrays in position order
+        """
+        if self._soa is None:
+            count = len(self._positions)
+            self._soa = (
+                np.fromiter((p.x for p in self._positions), dtype=np.int16, count=count),
+                np.fromiter((p.y for p in self._positions), dtype=np.int16, count=count),
+                np.array([p.part_type for p in self._positions], dtype=str),
+                np.array([p.lego_part_id for p in self._positions], dtype=str)
+            )
+        return self._soa
+
+    def color_counts_by_part_type(self) -> Dict[str, List[Tuple[str, str, int]]]:
+        """Count positions per color for each part type in one pass.
+
+        Returns:
+            Map of part type ("brick", "tile") to (color_id, color_name, count)
+            entries, ordered by each color's first occurrence for that part type
+        """
+        counts = {"brick": Counter(), "tile": Counter()}
+        color_names = {}
+        for pos in self._positions:
+            color_names[pos.color_id] = pos.color_name
+            counts[pos.part_type][pos.color_id] += 1
+
+        return {
+            part_type: [
+                (color_id, color_names[color_id], count)
+                for color_id, count in counter.items()
+            ]
+            for part_type, counter in counts.items()
+        }
+
     def add_position(self, position: PositionPlacement) -> None:
         """Add a position to the grid.
 
@@ -186,6 +233,7 @@ class PositionPlacementGrid:
         """
         self._positions.append(position)
         self._position_map[(position.x, position.y)] = position
+        self._soa = None
         self._compute_counts()
 
     def get_position(self, x: int, y: int) -> Optional[PositionPlacement]:
@@ -278,7 +326,7 @@ class PositionPlacementGrid:
             "positions": [p.to_dict() for p in self._positions],
             "statistics": self.compute_statistics().to_dict()
         }
-        return json.dumps(data, indent=indent)
+        return json_codec.dumps(data, indent=indent)
 
     def to_csv(self) -> str:
         """Serialize grid to CSV string.
@@ -295,12 +343,12 @@ class PositionPlacementGrid:
             "lego_color_code", "part_type", "lego_part_id"
         ])
 
-        # Write positions
-        for pos in self._positions:
-            writer.writerow([
-                pos.x, pos.y, pos.color_id, pos.color_name,
-                pos.lego_color_code, pos.part_type, pos.lego_part_id
-            ])
+        # Write positions in one call; the C writer buffers rows into output
+        writer.writerows(
+            (pos.x, pos.y, pos.color_id, pos.color_name,
+             pos.lego_color_code, pos.part_type, pos.lego_part_id)
+            for pos in self._positions
+        )
 
         return output.getvalue()
 
@@ -314,7 +362,7 @@ class PositionPlacementGrid:
         Returns:
             New PositionPlacementGrid instance
         """
-        data = json.loads(json_str)
+        data = json_codec.loads(json_str)
         metadata = data["metadata"]
 
         positions = [
@@ -2,23 +2,30 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, FrozenSet, Mapping, Tuple
+from weakref import WeakValueDictionary
+
+from ..core import json_codec
 
 
 # Default kit configuration path
 KIT_DATA_PATH = Path(__file__).parent.parent / "data" / "lego_world_map_kit.json"
 
 
-@dataclass
+@dataclass(frozen=True)
 class LEGOWorldMapKitSpecification:
     """Reference data for official LEGO World Map kit 31203.
 
     Contains constant structure (dimensions, part types) and variable
     components (available colors, quantities) for validation.
 
+    Instances are immutable: color lists are stored as tuples and quantity
+    maps as read-only mappings, so a loaded specification can be shared.
+
     Attributes:
         kit_id: Official LEGO kit ID (e.g., "31203")
         kit_name: Official kit name
@@ -47,10 +54,26 @@ class LEGOWorldMapKitSpecification:
     ocean_part_id: str
 
     # Variable components
-    available_colors_brick: List[str] = field(default_factory=list)
-    available_colors_tile: List[str] = field(default_factory=list)
-    brick_quantities: Dict[str, int] = field(default_factory=dict)
-    tile_quantities: Dict[str, int] = field(default_factory=dict)
+    available_colors_brick: Tuple[str, ...] = field(default_factory=tuple)
+    available_colors_tile: Tuple[str, ...] = field(default_factory=tuple)
+    brick_quantities: Mapping[str, int] = field(default_factory=dict)
+    tile_quantities: Mapping[str, int] = field(default_factory=dict)
+
+    # Specifications parsed by from_json, keyed by their JSON text
+    _from_json_cache: ClassVar[WeakValueDictionary] = WeakValueDictionary()
+
+    # Set views of the available colors for O(1) availability checks
+    _brick_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _tile_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Freeze color lists and quantity maps against mutation."""
+        object.__setattr__(self, "available_colors_brick", tuple(self.available_colors_brick))
+        object.__setattr__(self, "available_colors_tile", tuple(self.available_colors_tile))
+        object.__setattr__(self, "brick_quantities", MappingProxyType(dict(self.brick_quantities)))
+        object.__setattr__(self, "tile_quantities", MappingProxyType(dict(self.tile_quantities)))
+        object.__setattr__(self, "_brick_set", frozenset(self.available_colors_brick))
+        object.__setattr__(self, "_tile_set", frozenset(self.available_colors_tile))
 
     def is_brick_color_available(self, color_id: str) -> bool:
         """Check if color is available for round bricks.
@@ -61,7 +84,7 @@ class LEGOWorldMapKitSpecification:
         Returns:
             True if color is available for bricks
         """
-        return color_id in self.available_colors_brick
+        return color_id in self._brick_set
 
     def is_tile_color_available(self, color_id: str) -> bool:
         """Check if color is available for flat tiles.
@@ -72,7 +95,7 @@ class LEGOWorldMapKitSpecification:
         Returns:
             True if color is available for tiles
         """
-        return color_id in self.available_colors_tile
+        return color_id in self._tile_set
 
     def get_brick_quantity(self, color_id: str) -> int:
         """Get available quantity of brick color.
@@ -112,23 +135,34 @@ class LEGOWorldMapKitSpecification:
             "ocean_positions": self.ocean_positions,
             "land_part_id": self.land_part_id,
             "ocean_part_id": self.ocean_part_id,
-            "available_colors_brick": self.available_colors_brick,
-            "available_colors_tile": self.available_colors_tile,
-            "brick_quantities": self.brick_quantities,
-            "tile_quantities": self.tile_quantities
+            "available_colors_brick": list(self.available_colors_brick),
+            "available_colors_tile": list(self.available_colors_tile),
+            "brick_quantities": dict(self.brick_quantities),
+            "tile_quantities": dict(self.tile_quantities)
         }
 
     @classmethod
     def from_json(cls, json_str: str) -> LEGOWorldMapKitSpecification:
         """Create kit specification from JSON string.
 
+        Specifications are immutable, so repeated calls with the same text
+        return the same instance for as long as it is still referenced.
+
         Args:
             json_str: JSON string
 
         Returns:
-            New kit specification instance
+            Kit specification instance
         """
-        data = json.loads(json_str)
+        spec = cls._from_json_cache.get(json_str)
+        if spec is None:
+            spec = cls._from_dict(json_codec.loads(json_str))
+            cls._from_json_cache[json_str] = spec
+        return spec
+
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]) -> LEGOWorldMapKitSpecification:
+        """Create kit specification from parsed kit JSON data."""
         return cls(
             kit_id=data["kit_id"],
             kit_name=data["kit_name"],
@@ -146,9 +180,13 @@ class LEGOWorldMapKitSpecification:
         )
 
 
+@lru_cache(maxsize=8)
 def load_kit_specification(kit_id: str = "31203") -> LEGOWorldMapKitSpecification:
     """Load kit specification from configuration file.
 
+    Uses @lru_cache so each kit file is read and parsed once; the returned
+    specification is immutable and safe to share between callers.
+
     Args:
         kit_id: Kit ID to load (currently only "31203" supported)
 
@@ -168,21 +206,7 @@ def load_kit_specification(kit_id: str = "31203") -> LEGOWorldMapKitSpecificatio
     if not KIT_DATA_PATH.exists():
         raise FileNotFoundError(f"Kit configuration file not found: {KIT_DATA_PATH}")
 
-    with open(KIT_DATA_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    return LEGOWorldMapKitSpecification(
-        kit_id=data["kit_id"],
-        kit_name=data["kit_name"],
-        base_plate_width=data["base_plate_width"],
-        base_plate_height=data["base_plate_height"],
-        total_positions=data["total_positions"],
-        land_positions=data["land_positions"],
-        ocean_positions=data["ocean_positions"],
-        land_part_id=data["land_part_id"],
-        ocean_part_id=data["ocean_part_id"],
-        available_colors_brick=data.get("available_colors_brick", []),
-        available_colors_tile=data.get("available_colors_tile", []),
-        brick_quantities=data.get("brick_quantities", {}),
-        tile_quantities=data.get("tile_quantities", {})
-    )
+    with open(KIT_DATA_PATH, "rb") as f:
+        data = json_codec.loads(f.read())
+
+    return LEGOWorldMapKitSpecification._from_dict(data)
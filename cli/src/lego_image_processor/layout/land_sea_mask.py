@@ -7,10 +7,18 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Set, Tuple
 
+import numpy as np
+from numpy.typing import NDArray
 
 # Path to the land/sea mask fixture
 MASK_PATH = Path(__file__).parent.parent.parent.parent / "tests" / "fixtures" / "lego_world_map_land_sea_mask.json"
 
+# Kit 31203 mask dimensions, used for packed mask files (which carry no header)
+MASK_WIDTH = 128
+MASK_HEIGHT = 80
+
+DEFAULT_SOURCE = "LEGO World Map kit 31203 instruction manual"
+
 
 class LandSeaMask:
     """Binary classification of grid positions into land (bricks) or ocean (tiles).
@@ -49,13 +57,51 @@ class LandSeaMask:
         """
         self._width = width
         self._height = height
-        self._land_positions = land_positions
         self._source = source
         self._extracted_date = extracted_date
 
+        # Store land as a (height, width) boolean bitmap indexed [y, x]
+        land = np.zeros((height, width), dtype=bool)
+        if land_positions:
+            xs, ys = (np.fromiter(c, dtype=np.intp) for c in zip(*land_positions))
+            if xs.min() < 0 or xs.max() >= width or ys.min() < 0 or ys.max() >= height:
+                raise ValueError(f"Land coordinates must lie within {width}x{height}")
+            land[ys, xs] = True
+        self._set_land(land)
+
+    @classmethod
+    def from_array(cls, land: NDArray[np.bool_], source: str, extracted_date: str) -> LandSeaMask:
+        """Create a mask directly from a boolean land array.
+
+        Args:
+            land: Array of shape (height, width) indexed [y, x], True where land
+            source: Extraction source reference
+            extracted_date: Extraction date
+
+        Returns:
+            LandSeaMask instance
+        """
+        # Bypass __init__, which would build the bitmap from a position set
+        mask = cls.__new__(cls)
+        mask._height, mask._width = land.shape
+        mask._source = source
+        mask._extracted_date = extracted_date
+        mask._set_land(np.array(land, dtype=bool))
+        return mask
+
+    def _set_land(self, land: NDArray[np.bool_]) -> None:
+        """Install the land bitmap and recompute counts."""
+        land.flags.writeable = False
+        self._land = land
+
+        # One Python int bitset per row (bit x set where land) for scalar lookups,
+        # which avoids NumPy scalar indexing overhead in is_land
+        packed = np.packbits(land, axis=1, bitorder="little")
+        self._row_bits = tuple(int.from_bytes(row.tobytes(), "little") for row in packed)
+
         # Compute counts
-        self._land_count = len(land_positions)
-        self._total_positions = width * height
+        self._land_count = self.count_land()
+        self._total_positions = self._width * self._height
         self._ocean_count = self._total_positions - self._land_count
 
     @property
@@ -125,7 +171,23 @@ class LandSeaMask:
         if y < 0 or y >= self._height:
             raise IndexError(f"y coordinate {y} out of range [0, {self._height})")
 
-        return (x, y) in self._land_positions
+        return bool((self._row_bits[y] >> x) & 1)
+
+    def as_array(self) -> NDArray[np.bool_]:
+        """Get the mask as a read-only boolean array.
+
+        Returns:
+            Array of shape (height, width) indexed [y, x], True where land
+        """
+        return self._land
+
+    def count_land(self) -> int:
+        """Count land positions with a single vectorized sum.
+
+        Returns:
+            Number of land positions
+        """
+        return int(np.count_nonzero(self._land))
 
     def get_part_type(self, x: int, y: int) -> str:
         """Get part type for position.
@@ -152,11 +214,60 @@ class LandSeaMask:
         return "3062b" if self.is_land(x, y) else "98138"
 
 
-@lru_cache(maxsize=1)
+def save_packed_mask(mask: LandSeaMask, path: str | Path) -> None:
+    """Write a mask as a packed bitmap (one bit per position, rows padded to bytes).
+
+    The result can be passed to load_land_sea_mask as an explicit mask_path.
+    Only the bits are stored: a packed mask loads back with the default source
+    and an empty extracted_date.
+
+    Args:
+        mask: 128x80 mask to write
+        path: Output file path
+
+    Raises:
+        ValueError: If the mask is not 128x80
+    """
+    if (mask.width, mask.height) != (MASK_WIDTH, MASK_HEIGHT):
+        raise ValueError(
+            f"Packed masks must be {MASK_WIDTH}x{MASK_HEIGHT}, got {mask.width}x{mask.height}"
+        )
+    np.packbits(mask.as_array(), axis=1).tofile(path)
+
+
+def _load_packed_mask(path: Path) -> LandSeaMask:
+    """Load a packed bitmap written by save_packed_mask via a memory map.
+
+    Args:
+        path: Packed mask file
+
+    Returns:
+        LandSeaMask instance
+
+    Raises:
+        ValueError: If the file size doesn't match a 128x80 packed mask
+    """
+    row_bytes = (MASK_WIDTH + 7) // 8
+    if path.stat().st_size != MASK_HEIGHT * row_bytes:
+        raise ValueError(
+            f"Packed mask {path} has {path.stat().st_size} bytes, "
+            f"expected {MASK_HEIGHT * row_bytes}"
+        )
+
+    packed = np.memmap(path, dtype=np.uint8, mode="r", shape=(MASK_HEIGHT, row_bytes))
+    land = np.unpackbits(packed, axis=1, count=MASK_WIDTH).astype(bool)
+
+    return LandSeaMask.from_array(land, source=DEFAULT_SOURCE, extracted_date="")
+
+
+@lru_cache(maxsize=8)
 def load_land_sea_mask(mask_path: str = None) -> LandSeaMask:
     """Load land/sea mask from fixture file.
 
-    Uses @lru_cache to avoid reloading the file on repeated calls.
+    Uses @lru_cache to avoid reloading the file on repeated calls. The returned
+    mask is immutable, so every caller can share the cached instance. Files with
+    a ".bin" suffix are read as packed bitmaps (see save_packed_mask); anything
+    else is parsed as JSON. Without a mask_path, MASK_PATH is loaded.
 
     Args:
         mask_path: Optional custom path to mask file (for testing)
@@ -173,6 +284,24 @@ def load_land_sea_mask(mask_path: str = None) -> LandSeaMask:
     if not path.exists():
         raise FileNotFoundError(f"Land/sea mask file not found: {path}")
 
+    if path.suffix == ".bin":
+        return _load_packed_mask(path)
+
+    return _load_json_mask(path)
+
+
+def _load_json_mask(path: Path) -> LandSeaMask:
+    """Parse a land/sea mask JSON file.
+
+    Args:
+        path: Mask JSON file
+
+    Returns:
+        LandSeaMask instance
+
+    Raises:
+        ValueError: If mask has invalid structure
+    """
     with open(path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
@@ -198,7 +327,7 @@ def load_land_sea_mask(mask_path: str = None) -> LandSeaMask:
         )
 
     # Get metadata
-    source = data.get("source", "LEGO World Map kit 31203 instruction manual")
+    source = data.get("source", DEFAULT_SOURCE)
     # Handle both possible field names for the date
     extracted_date = data.get("extracted_date", data.get("extraction_date", ""))
 
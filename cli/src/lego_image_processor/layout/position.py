@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Sequence, Tuple
 
+import numpy as np
+from numpy.typing import NDArray
 
-@dataclass(frozen=True)
+
+# Each part type maps to exactly one LEGO part number
+_PART_TYPE_TO_ID = {"brick": "3062b", "tile": "98138"}
+_VALID_PART_IDS = frozenset(_PART_TYPE_TO_ID.values())
+
+
+@dataclass(frozen=True, slots=True)
 class PositionPlacement:
     """Represents a single LEGO part placement at a specific grid position.
 
@@ -40,18 +49,20 @@ class PositionPlacement:
             raise ValueError(f"y coordinate must be >= 0, got {self.y}")
 
         # Validate part_type
-        if self.part_type not in ("brick", "tile"):
+        expected_part_id = _PART_TYPE_TO_ID.get(self.part_type)
+        if expected_part_id is None:
             raise ValueError(f"part_type must be 'brick' or 'tile', got '{self.part_type}'")
 
-        # Validate lego_part_id
-        if self.lego_part_id not in ("3062b", "98138"):
-            raise ValueError(f"lego_part_id must be '3062b' or '98138', got '{self.lego_part_id}'")
+        if self.lego_part_id != expected_part_id:
+            # Validate lego_part_id
+            if self.lego_part_id not in _VALID_PART_IDS:
+                raise ValueError(f"lego_part_id must be '3062b' or '98138', got '{self.lego_part_id}'")
 
-        # Validate invariant: part_type and lego_part_id must match
-        if self.part_type == "brick" and self.lego_part_id != "3062b":
-            raise ValueError(f"part_type 'brick' must use lego_part_id '3062b', got '{self.lego_part_id}'")
-        if self.part_type == "tile" and self.lego_part_id != "98138":
-            raise ValueError(f"part_type 'tile' must use lego_part_id '98138', got '{self.lego_part_id}'")
+            # Validate invariant: part_type and lego_part_id must match
+            raise ValueError(
+                f"part_type '{self.part_type}' must use lego_part_id "
+                f"'{expected_part_id}', got '{self.lego_part_id}'"
+            )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert position placement to dictionary.
@@ -73,6 +84,9 @@ class PositionPlacement:
     def from_dict(cls, data: Dict[str, Any]) -> PositionPlacement:
         """Create position placement from dictionary.
 
+        String fields are interned, since a parsed layout repeats the same
+        few color and part strings across thousands of positions.
+
         Args:
             data: Dictionary with position attributes.
 
@@ -82,11 +96,11 @@ class PositionPlacement:
         return cls(
             x=data["x"],
             y=data["y"],
-            color_id=data["color_id"],
-            color_name=data["color_name"],
-            lego_color_code=data["lego_color_code"],
-            part_type=data["part_type"],
-            lego_part_id=data["lego_part_id"]
+            color_id=sys.intern(data["color_id"]),
+            color_name=sys.intern(data["color_name"]),
+            lego_color_code=sys.intern(data["lego_color_code"]),
+            part_type=sys.intern(data["part_type"]),
+            lego_part_id=sys.intern(data["lego_part_id"])
         )
 
     def __repr__(self) -> str:
@@ -96,3 +110,156 @@ class PositionPlacement:
             f"color_id='{self.color_id}', part_type='{self.part_type}', "
             f"lego_part_id='{self.lego_part_id}')"
         )
+
+
+class PositionPlacementArray:
+    """Column-oriented storage for many position placements.
+
+    Keeps coordinates, color indices and part type indices in parallel NumPy
+    arrays (structure of arrays) instead of one Python object per position.
+    Row i of the columns describes one placement; PositionPlacement objects
+    are only built on demand by placement() and iter_placements().
+
+    Attributes:
+        xs: X coordinates (int16)
+        ys: Y coordinates (int16)
+        color_idx: Index into color_table for each position (uint8)
+        part_type_idx: Index into PART_TYPES for each position (uint8)
+        color_table: (color_id, color_name, lego_color_code) per color index
+    """
+
+    # Part type index -> (part_type, lego_part_id)
+    PART_TYPES: Tuple[Tuple[str, str], ...] = (("brick", "3062b"), ("tile", "98138"))
+
+    def __init__(
+        self,
+        xs: NDArray[np.int16],
+        ys: NDArray[np.int16],
+        color_idx: NDArray[np.uint8],
+        part_type_idx: NDArray[np.uint8],
+        color_table: Sequence[Tuple[str, str, str]]
+    ):
+        """Initialize placement array.
+
+        Args:
+            xs: X coordinates
+            ys: Y coordinates
+            color_idx: Index into color_table for each position
+            part_type_idx: 0 for brick (land), 1 for tile (ocean)
+            color_table: (color_id, color_name, lego_color_code) per color index
+
+        Raises:
+            ValueError: If the columns differ in length, color_table has more
+                than 256 entries, or a color index falls outside color_table
+        """
+        # Check indices before the uint8 cast, which would silently wrap them
+        color_idx = np.asarray(color_idx)
+        if len(color_table) > 256:
+            raise ValueError(f"color_table may hold at most 256 colors, got {len(color_table)}")
+        if color_idx.size and (color_idx.min() < 0 or color_idx.max() >= len(color_table)):
+            raise ValueError(
+                f"Color indices must lie in [0, {len(color_table)}), "
+                f"got [{color_idx.min()}, {color_idx.max()}]"
+            )
+
+        self.xs = np.asarray(xs, dtype=np.int16)
+        self.ys = np.asarray(ys, dtype=np.int16)
+        self.color_idx = color_idx.astype(np.uint8, copy=False)
+        self.part_type_idx = np.asarray(part_type_idx, dtype=np.uint8)
+        self.color_table = tuple(color_table)
+
+        lengths = {len(self.xs), len(self.ys), len(self.color_idx), len(self.part_type_idx)}
+        if len(lengths) != 1:
+            raise ValueError(f"Column arrays must have equal length, got {sorted(lengths)}")
+
+    @classmethod
+    def from_mask_and_colors(
+        cls,
+        mask_array: NDArray[np.bool_],
+        color_idx_array: NDArray[np.integer],
+        color_table: Sequence[Tuple[str, str, str]]
+    ) -> PositionPlacementArray:
+        """Build placements for a whole grid in one vectorized step.
+
+        Positions are emitted in row-major order (y, then x), matching the
+        order the layout generator walks the image.
+
+        Args:
+            mask_array: Boolean array of shape (height, width), True where land
+            color_idx_array: Color index per cell, same shape as mask_array
+            color_table: (color_id, color_name, lego_color_code) per color index
+
+        Returns:
+            New PositionPlacementArray with height * width rows
+
+        Raises:
+            ValueError: If the mask and color arrays differ in shape, or the
+                color indices don't fit color_table (see __init__)
+        """
+        mask_array = np.asarray(mask_array, dtype=bool)
+        color_idx_array = np.asarray(color_idx_array)
+        if mask_array.shape != color_idx_array.shape:
+            raise ValueError(
+                f"Mask shape {mask_array.shape} does not match color shape {color_idx_array.shape}"
+            )
+
+        height, width = mask_array.shape
+        ys, xs = np.meshgrid(
+            np.arange(height, dtype=np.int16), np.arange(width, dtype=np.int16), indexing="ij"
+        )
+        return cls(
+            xs=xs.ravel(),
+            ys=ys.ravel(),
+            color_idx=color_idx_array.ravel(),
+            part_type_idx=(~mask_array).ravel(),
+            color_table=color_table
+        )
+
+    def __len__(self) -> int:
+        """Return the number of placements."""
+        return len(self.xs)
+
+    def placement(self, index: int) -> PositionPlacement:
+        """Build the PositionPlacement for one row.
+
+        Args:
+            index: Row index
+
+        Returns:
+            PositionPlacement for that row
+        """
+        color_id, color_name, lego_color_code = self.color_table[self.color_idx[index]]
+        part_type, lego_part_id = self.PART_TYPES[self.part_type_idx[index]]
+        return PositionPlacement(
+            x=int(self.xs[index]),
+            y=int(self.ys[index]),
+            color_id=color_id,
+            color_name=color_name,
+            lego_color_code=lego_color_code,
+            part_type=part_type,
+            lego_part_id=lego_part_id
+        )
+
+    def iter_placements(self) -> Iterator[PositionPlacement]:
+        """Lazily yield a PositionPlacement for each row in order.
+
+        Yields:
+            PositionPlacement objects in row order
+        """
+        color_table = self.color_table
+        part_types = self.PART_TYPES
+        for x, y, c, p in zip(
+            self.xs.tolist(), self.ys.tolist(),
+            self.color_idx.tolist(), self.part_type_idx.tolist()
+        ):
+            color_id, color_name, lego_color_code = color_table[c]
+            part_type, lego_part_id = part_types[p]
+            yield PositionPlacement(
+                x=x,
+                y=y,
+                color_id=color_id,
+                color_name=color_name,
+                lego_color_code=lego_color_code,
+                part_type=part_type,
+                lego_part_id=lego_part_id
+            )
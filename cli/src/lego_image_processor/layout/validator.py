@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
-import json
+import sys
 from abc import ABC, abstractmethod
-from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 
+import numpy as np
+from numpy.typing import NDArray
+
+from ..core import json_codec
 from .grid import PositionPlacementGrid
 from .kit_spec import LEGOWorldMapKitSpecification
 from ..palette.loader import LegoPalette
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorSuggestion:
     """Suggested alternative color for unavailable colors.
 
@@ -37,16 +40,24 @@ class ColorSuggestion:
         }
 
 
+def _intern_fields(obj: Any, *names: str) -> None:
+    """Replace the named string fields of a frozen dataclass with interned copies."""
+    for name in names:
+        object.__setattr__(obj, name, sys.intern(getattr(obj, name)))
+
+
 class Violation(ABC):
     """Abstract base class for validation violations."""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
         """Convert violation to dictionary."""
         pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorUnavailableViolation(Violation):
     """Color required by layout is not available in kit for part type.
 
@@ -67,6 +78,10 @@ class ColorUnavailableViolation(Violation):
     positions_required: int
     suggested_alternative: Optional[ColorSuggestion] = None
 
+    def __post_init__(self) -> None:
+        """Intern string fields repeated across violations."""
+        _intern_fields(self, "part_type", "color_id", "color_name")
+
     @property
     def type(self) -> str:
         return "color_unavailable"
@@ -86,7 +101,7 @@ class ColorUnavailableViolation(Violation):
         return result
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuantityExceededViolation(Violation):
     """Layout requires more parts of color/type than kit provides.
 
@@ -109,6 +124,10 @@ class QuantityExceededViolation(Violation):
     kit_quantity: int
     shortfall: int
 
+    def __post_init__(self) -> None:
+        """Intern string fields repeated across violations."""
+        _intern_fields(self, "part_type", "color_id", "color_name")
+
     @property
     def type(self) -> str:
         return "quantity_exceeded"
@@ -127,7 +146,7 @@ class QuantityExceededViolation(Violation):
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationReport:
     """Result of validating layout against kit specifications.
 
@@ -135,9 +154,10 @@ class ValidationReport:
         buildable: Overall buildability flag (True if no violations)
         buildability_score: Percentage buildable (0.0-1.0)
         violations: List of compatibility issues
-        validated_at: Validation timestamp
+        validated_at: Validation timestamp (ISO 8601 string)
         kit_id: Kit validated against
         layout_file: Validated layout file path
+        validated_at_datetime: validated_at parsed once at construction
     """
 
     buildable: bool
@@ -146,6 +166,17 @@ class ValidationReport:
     validated_at: str
     kit_id: str
     layout_file: str
+    validated_at_datetime: datetime = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Parse validated_at, rejecting timestamps that are not ISO 8601.
+
+        Raises:
+            ValueError: If validated_at is not an ISO 8601 timestamp
+        """
+        object.__setattr__(
+            self, "validated_at_datetime", datetime.fromisoformat(self.validated_at)
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert report to dictionary."""
@@ -160,7 +191,7 @@ class ValidationReport:
 
     def to_json(self, indent: int = 2) -> str:
         """Convert report to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return json_codec.dumps(self.to_dict(), indent=indent)
 
 
 class LayoutValidator:
@@ -185,6 +216,9 @@ class LayoutValidator:
             color_id = self._make_color_id(color.name)
             self._color_by_id[color_id] = color
 
+        # Candidate tables for _find_nearest_color, keyed by available color list
+        self._candidate_tables: Dict[Tuple[str, ...], Tuple[List[str], List[str], NDArray[np.float64]]] = {}
+
     def validate(self, layout: PositionPlacementGrid, layout_file: str) -> ValidationReport:
         """Validate layout against kit specifications.
 
@@ -199,21 +233,10 @@ class LayoutValidator:
         total_violation_positions = 0
 
         # Count colors by part type
-        brick_colors = Counter()
-        tile_colors = Counter()
-        color_names = {}
-
-        for pos in layout.positions:
-            color_names[pos.color_id] = pos.color_name
-            if pos.part_type == "brick":
-                brick_colors[pos.color_id] += 1
-            else:
-                tile_colors[pos.color_id] += 1
+        color_counts = layout.color_counts_by_part_type()
 
         # Validate brick colors
-        for color_id, count in brick_colors.items():
-            color_name = color_names.get(color_id, color_id)
-
+        for color_id, color_name, count in color_counts["brick"]:
             # Check if color is available
             if not self._kit_spec.is_brick_color_available(color_id):
                 suggestion = self._find_nearest_color(
@@ -244,9 +267,7 @@ class LayoutValidator:
                     total_violation_positions += (count - available)
 
         # Validate tile colors
-        for color_id, count in tile_colors.items():
-            color_name = color_names.get(color_id, color_id)
-
+        for color_id, color_name, count in color_counts["tile"]:
             # Check if color is available
             if not self._kit_spec.is_tile_color_available(color_id):
                 suggestion = self._find_nearest_color(
@@ -293,13 +314,13 @@ class LayoutValidator:
     def _find_nearest_color(
         self,
         target_color_id: str,
-        available_colors: List[str]
+        available_colors: Sequence[str]
     ) -> Optional[ColorSuggestion]:
         """Find nearest available color using Delta E distance.
 
         Args:
             target_color_id: Color to find alternative for
-            available_colors: List of available color IDs
+            available_colors: Available color IDs
 
         Returns:
             ColorSuggestion or None if no alternative found
@@ -308,44 +329,52 @@ class LayoutValidator:
         if not target_color:
             return None
 
-        best_suggestion = None
-        best_distance = float('inf')
-
-        for color_id in available_colors:
-            candidate = self._color_by_id.get(color_id)
-            if not candidate:
-                continue
-
-            # Calculate simple Euclidean distance (for now)
-            # In production, use Delta E 2000
-            distance = self._calculate_color_distance(target_color.rgb, candidate.rgb)
+        candidate_ids, candidate_names, candidate_rgb = self._candidate_table(available_colors)
+        if not candidate_ids:
+            return None
 
-            if distance < best_distance:
-                best_distance = distance
-                best_suggestion = ColorSuggestion(
-                    color_id=color_id,
-                    color_name=candidate.name,
-                    color_distance=distance
-                )
+        # Calculate simple Euclidean distance (for now)
+        # In production, use Delta E 2000
+        diff = candidate_rgb - np.array(target_color.rgb, dtype=np.float64)
+        distances = np.sqrt((diff * diff).sum(axis=1))
+
+        # argmin keeps the first of equally near candidates
+        best = int(np.argmin(distances))
+        return ColorSuggestion(
+            color_id=candidate_ids[best],
+            color_name=candidate_names[best],
+            color_distance=float(distances[best])
+        )
 
-        return best_suggestion
+    def _candidate_table(
+        self,
+        available_colors: Sequence[str]
+    ) -> Tuple[List[str], List[str], NDArray[np.float64]]:
+        """Get ids, names and RGB rows of the known colors in available_colors.
 
-    @staticmethod
-    def _calculate_color_distance(rgb1: tuple, rgb2: tuple) -> float:
-        """Calculate simple Euclidean distance between RGB colors.
+        Built once per distinct color list and cached, since validation asks
+        for suggestions against the same kit color lists repeatedly.
 
         Args:
-            rgb1: First RGB tuple
-            rgb2: Second RGB tuple
+            available_colors: Available color IDs
 
         Returns:
-            Distance value
+            Tuple of (color ids, color names, (N, 3) RGB array), in list order
         """
-        return (
-            (rgb1[0] - rgb2[0]) ** 2 +
-            (rgb1[1] - rgb2[1]) ** 2 +
-            (rgb1[2] - rgb2[2]) ** 2
-        ) ** 0.5
+        key = tuple(available_colors)
+        table = self._candidate_tables.get(key)
+        if table is None:
+            colors = [
+                (color_id, self._color_by_id[color_id])
+                for color_id in key if color_id in self._color_by_id
+            ]
+            table = (
+                [color_id for color_id, _ in colors],
+                [color.name for _, color in colors],
+                np.array([color.rgb for _, color in colors], dtype=np.float64).reshape(-1, 3)
+            )
+            self._candidate_tables[key] = table
+        return table
 
     @staticmethod
     def _make_color_id(color_name: str) -> str:
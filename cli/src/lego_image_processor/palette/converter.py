@@ -6,37 +6,109 @@ import numpy as np
 from numpy.typing import NDArray
 
 
+# RGB to XYZ transformation matrix (sRGB D65)
+_RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041]
+])
+
+# XYZ to RGB transformation matrix (sRGB D65)
+_XYZ_TO_RGB = np.array([
+    [ 3.2404542, -1.5371385, -0.4985314],
+    [-0.9692660,  1.8760108,  0.0415560],
+    [ 0.0556434, -0.2040259,  1.0572252]
+])
+
+# D65 reference white
+_REF_WHITE = np.array([95.047, 100.000, 108.883])
+
+# CIE LAB f function constants
+_EPSILON = 0.008856
+_KAPPA = 903.3
+
+# Fused matrices mapping linear RGB directly to white-normalized XYZ and back,
+# so the LAB paths skip the separate *100 and /ref_white passes
+_RGB_TO_XYZ_NORMALIZED = _RGB_TO_XYZ * (100 / _REF_WHITE)[:, None]
+_XYZ_NORMALIZED_TO_RGB = _XYZ_TO_RGB * (_REF_WHITE / 100)[None, :]
+
+
+def _srgb_to_linear(rgb: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Normalize RGB in [0, 255] and undo sRGB gamma.
+
+    uint8 input is looked up in _SRGB_LUT. Other input is converted in place
+    on a single output buffer rather than evaluating both branches into
+    temporaries for np.where.
+    """
+    rgb = np.asarray(rgb)
+    if rgb.dtype == np.uint8:
+        return _SRGB_LUT[rgb]
+
+    linear = np.divide(rgb, 255.0)
+    low = linear <= 0.04045
+    low_values = linear[low] / 12.92
+
+    linear += 0.055
+    linear /= 1.055
+    np.power(linear, 2.4, out=linear)
+    linear[low] = low_values
+    return linear
+
+
+# Linear value for each of the 256 uint8 channel values, so 8-bit input
+# needs a single gather instead of the piecewise power
+_SRGB_LUT = _srgb_to_linear(np.arange(256, dtype=np.float64))
+_SRGB_LUT.flags.writeable = False
+
+
+def _linear_to_srgb(rgb_linear: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Apply sRGB gamma and scale to [0, 255], clamping out-of-gamut values."""
+    rgb_normalized = np.where(
+        rgb_linear > 0.0031308,
+        1.055 * np.power(np.maximum(rgb_linear, 0), 1/2.4) - 0.055,
+        12.92 * rgb_linear
+    )
+    return np.clip(rgb_normalized * 255, 0, 255)
+
+
+def _normalized_xyz_to_lab(xyz_normalized: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Convert white-normalized XYZ to LAB."""
+    f_xyz = np.where(
+        xyz_normalized > _EPSILON,
+        np.cbrt(xyz_normalized),
+        (_KAPPA * xyz_normalized + 16) / 116
+    )
+
+    L = 116 * f_xyz[..., 1] - 16
+    a = 500 * (f_xyz[..., 0] - f_xyz[..., 1])
+    b = 200 * (f_xyz[..., 1] - f_xyz[..., 2])
+
+    return np.stack([L, a, b], axis=-1)
+
+
+def _lab_to_normalized_xyz(lab: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Convert LAB to white-normalized XYZ."""
+    fy = (lab[..., 0] + 16) / 116
+    fx = lab[..., 1] / 500 + fy
+    fz = fy - lab[..., 2] / 200
+
+    xr = np.where(fx ** 3 > _EPSILON, fx ** 3, (116 * fx - 16) / _KAPPA)
+    yr = np.where(lab[..., 0] > _KAPPA * _EPSILON, fy ** 3, lab[..., 0] / _KAPPA)
+    zr = np.where(fz ** 3 > _EPSILON, fz ** 3, (116 * fz - 16) / _KAPPA)
+
+    return np.stack([xr, yr, zr], axis=-1)
+
+
 def rgb_to_xyz(rgb: NDArray[np.float64]) -> NDArray[np.float64]:
     """Convert RGB to XYZ color space.
 
     Args:
-        rgb: RGB values in range [0, 255] with shape (..., 3)
+        rgb: RGB values in range [0, 255] with shape (..., 3), as floats or uint8
 
     Returns:
         XYZ values with shape (..., 3)
     """
-    # Normalize RGB to [0, 1]
-    rgb_normalized = rgb / 255.0
-
-    # Apply gamma correction (sRGB to linear)
-    mask = rgb_normalized > 0.04045
-    rgb_linear = np.where(
-        mask,
-        ((rgb_normalized + 0.055) / 1.055) ** 2.4,
-        rgb_normalized / 12.92
-    )
-
-    # RGB to XYZ transformation matrix (sRGB D65)
-    transform_matrix = np.array([
-        [0.4124564, 0.3575761, 0.1804375],
-        [0.2126729, 0.7151522, 0.0721750],
-        [0.0193339, 0.1191920, 0.9503041]
-    ])
-
-    # Apply transformation
-    xyz = np.dot(rgb_linear, transform_matrix.T) * 100
-
-    return xyz
+    return np.dot(_srgb_to_linear(rgb), _RGB_TO_XYZ.T) * 100
 
 
 def xyz_to_lab(xyz: NDArray[np.float64]) -> NDArray[np.float64]:
@@ -48,42 +120,20 @@ def xyz_to_lab(xyz: NDArray[np.float64]) -> NDArray[np.float64]:
     Returns:
         LAB values with shape (..., 3)
     """
-    # D65 reference white
-    ref_white = np.array([95.047, 100.000, 108.883])
-
-    # Normalize by reference white
-    xyz_normalized = xyz / ref_white
-
-    # Apply f function
-    epsilon = 0.008856
-    kappa = 903.3
-
-    mask = xyz_normalized > epsilon
-    f_xyz = np.where(
-        mask,
-        np.cbrt(xyz_normalized),
-        (kappa * xyz_normalized + 16) / 116
-    )
-
-    # Calculate LAB
-    L = 116 * f_xyz[..., 1] - 16
-    a = 500 * (f_xyz[..., 0] - f_xyz[..., 1])
-    b = 200 * (f_xyz[..., 1] - f_xyz[..., 2])
-
-    return np.stack([L, a, b], axis=-1)
+    return _normalized_xyz_to_lab(xyz / _REF_WHITE)
 
 
 def rgb_to_lab(rgb: NDArray[np.float64]) -> NDArray[np.float64]:
     """Convert RGB to LAB color space.
 
     Args:
-        rgb: RGB values in range [0, 255] with shape (..., 3)
+        rgb: RGB values in range [0, 255] with shape (..., 3), as floats or uint8
 
     Returns:
         LAB values with shape (..., 3)
     """
-    xyz = rgb_to_xyz(rgb)
-    return xyz_to_lab(xyz)
+    xyz_normalized = np.dot(_srgb_to_linear(rgb), _RGB_TO_XYZ_NORMALIZED.T)
+    return _normalized_xyz_to_lab(xyz_normalized)
 
 
 def lab_to_xyz(lab: NDArray[np.float64]) -> NDArray[np.float64]:
@@ -95,25 +145,7 @@ def lab_to_xyz(lab: NDArray[np.float64]) -> NDArray[np.float64]:
     Returns:
         XYZ values with shape (..., 3)
     """
-    # D65 reference white
-    ref_white = np.array([95.047, 100.000, 108.883])
-
-    # Calculate f values
-    fy = (lab[..., 0] + 16) / 116
-    fx = lab[..., 1] / 500 + fy
-    fz = fy - lab[..., 2] / 200
-
-    # Apply inverse f function
-    epsilon = 0.008856
-    kappa = 903.3
-
-    xr = np.where(fx ** 3 > epsilon, fx ** 3, (116 * fx - 16) / kappa)
-    yr = np.where(lab[..., 0] > kappa * epsilon, fy ** 3, lab[..., 0] / kappa)
-    zr = np.where(fz ** 3 > epsilon, fz ** 3, (116 * fz - 16) / kappa)
-
-    xyz = np.stack([xr, yr, zr], axis=-1) * ref_white
-
-    return xyz
+    return _lab_to_normalized_xyz(lab) * _REF_WHITE
 
 
 def xyz_to_rgb(xyz: NDArray[np.float64]) -> NDArray[np.float64]:
@@ -125,28 +157,7 @@ def xyz_to_rgb(xyz: NDArray[np.float64]) -> NDArray[np.float64]:
     Returns:
         RGB values in range [0, 255] with shape (..., 3)
     """
-    # XYZ to RGB transformation matrix (sRGB D65)
-    transform_matrix = np.array([
-        [ 3.2404542, -1.5371385, -0.4985314],
-        [-0.9692660,  1.8760108,  0.0415560],
-        [ 0.0556434, -0.2040259,  1.0572252]
-    ])
-
-    # Apply transformation
-    rgb_linear = np.dot(xyz / 100, transform_matrix.T)
-
-    # Apply gamma correction (linear to sRGB)
-    mask = rgb_linear > 0.0031308
-    rgb_normalized = np.where(
-        mask,
-        1.055 * np.power(np.maximum(rgb_linear, 0), 1/2.4) - 0.055,
-        12.92 * rgb_linear
-    )
-
-    # Clamp and scale to [0, 255]
-    rgb = np.clip(rgb_normalized * 255, 0, 255)
-
-    return rgb
+    return _linear_to_srgb(np.dot(xyz / 100, _XYZ_TO_RGB.T))
 
 
 def lab_to_rgb(lab: NDArray[np.float64]) -> NDArray[np.float64]:
@@ -158,5 +169,5 @@ def lab_to_rgb(lab: NDArray[np.float64]) -> NDArray[np.float64]:
     Returns:
         RGB values in range [0, 255] with shape (..., 3)
     """
-    xyz = lab_to_xyz(lab)
-    return xyz_to_rgb(xyz)
+    rgb_linear = np.dot(_lab_to_normalized_xyz(lab), _XYZ_NORMALIZED_TO_RGB.T)
+    return _linear_to_srgb(rgb_linear)
@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 
+import numpy as np
+from numpy.typing import NDArray
 
-@dataclass(frozen=True)
+from ..core import json_codec
+
+
+@dataclass(frozen=True, slots=True)
 class LegoColor:
-    """Represents a single LEGO color."""
+    """Represents a single LEGO color.
+
+    ``rgb_packed`` is derived from ``rgb`` as ``(r << 16) | (g << 8) | b`` so
+    colors can be compared and indexed as single integers.
+    """
 
     id: int
     name: str
     rgb: Tuple[int, int, int]
     hex: str
+    rgb_packed: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the packed integer RGB value."""
+        r, g, b = self.rgb
+        object.__setattr__(self, "rgb_packed", (r << 16) | (g << 8) | b)
 
     @classmethod
     def from_dict(cls, data: dict) -> LegoColor:
@@ -36,18 +51,28 @@ class LegoPalette:
         self._colors = colors
         self._color_by_id = {c.id: c for c in colors}
         self._color_by_name = {c.name.lower(): c for c in colors}
+        self._color_by_rgb = {c.rgb: c for c in colors}
+
+        # Contiguous (N, 3) uint8 copy of the palette colors for vectorized matching
+        self._rgb_array = np.array([c.rgb for c in colors], dtype=np.uint8).reshape(-1, 3)
+        self._rgb_array.flags.writeable = False
 
     @classmethod
+    @lru_cache(maxsize=1)
     def load_default(cls) -> LegoPalette:
-        """Load the default LEGO color palette."""
+        """Load the default LEGO color palette.
+
+        Uses @lru_cache so repeated calls share one parsed palette; palettes
+        are read-only, so sharing the instance is safe.
+        """
         palette_path = Path(__file__).parent / "lego_colors.json"
         return cls.load_from_file(palette_path)
 
     @classmethod
     def load_from_file(cls, path: Path) -> LegoPalette:
         """Load a LEGO color palette from a JSON file."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = json_codec.loads(f.read())
 
         colors = [LegoColor.from_dict(c) for c in data["colors"]]
         return cls(colors)
@@ -73,6 +98,15 @@ class LegoPalette:
         """Get a color by its name (case-insensitive)."""
         return self._color_by_name.get(name.lower())
 
+    def get_by_rgb(self, rgb: Tuple[int, int, int]) -> LegoColor | None:
+        """Get a color by its exact RGB value."""
+        return self._color_by_rgb.get(tuple(rgb))
+
+    @property
+    def rgb_array(self) -> NDArray[np.uint8]:
+        """All RGB values as a read-only (N, 3) uint8 array in palette order."""
+        return self._rgb_array
+
     def get_rgb_array(self) -> List[Tuple[int, int, int]]:
         """Get all RGB values as a list of tuples."""
         return [c.rgb for c in self._colors]
@@ -0,0 +1,170 @@
+"""Shared pytest fixtures for the LEGO Image Processor test suite."""
+
+from collections import Counter
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from PIL import Image
+
+from lego_image_processor.analysis.color_stats import ColorStatistics
+from lego_image_processor.core.color_quantizer import ColorQuantizer
+from lego_image_processor.layout.generator import LayoutGenerator
+from lego_image_processor.layout.kit_spec import load_kit_specification
+from lego_image_processor.layout.land_sea_mask import load_land_sea_mask
+from lego_image_processor.layout.validator import LayoutValidator
+from lego_image_processor.palette.loader import LegoPalette
+
+
+def pytest_sessionstart(session):
+    """Warm the memoized palette, kit spec and mask loaders before any test runs.
+
+    The loaders cache their results, so the session fixtures below return the
+    already-parsed objects. xdist workers are separate processes, not forks, so
+    each worker runs this hook and warms its own caches.
+    """
+    LegoPalette.load_default()
+    load_kit_specification("31203")
+    load_land_sea_mask()
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Create a CLI test runner shared across the session."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def palette():
+    """Load the default LEGO palette once per session."""
+    return LegoPalette.load_default()
+
+
+@pytest.fixture(scope="session")
+def palette_u32(palette):
+    """Default palette colors packed as (r << 16) | (g << 8) | b uint32 keys."""
+    return np.array([c.rgb_packed for c in palette.colors], dtype=np.uint32)
+
+
+@pytest.fixture(scope="session")
+def pack_rgb():
+    """Return a helper that packs an image's pixels like palette_u32."""
+    def _pack(img):
+        px = np.asarray(img, dtype=np.uint32)
+        return (px[..., 0] << 16) | (px[..., 1] << 8) | px[..., 2]
+
+    return _pack
+
+
+@pytest.fixture
+def gradient_image():
+    """Create a 20x20 image whose pixel (x, y) is (x * 12, y * 12, 128)."""
+    arr = np.empty((20, 20, 3), dtype=np.uint8)
+    arr[..., 0] = np.arange(20)[None, :] * 12
+    arr[..., 1] = np.arange(20)[:, None] * 12
+    arr[..., 2] = 128
+    return Image.fromarray(arr, mode="RGB")
+
+
+@pytest.fixture(scope="session")
+def random_pixels():
+    """Return a cached read-only (size, size, 3) uint8 array of random colors.
+
+    Each size is generated once per session from its own seeded generator, so
+    the global NumPy RNG state is left untouched.
+    """
+    cache = {}
+
+    def _get(size):
+        if size not in cache:
+            arr = np.random.default_rng(42).integers(0, 256, (size, size, 3), dtype=np.uint8)
+            arr.flags.writeable = False
+            cache[size] = arr
+        return cache[size]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def land_sea_mask():
+    """Load the land/sea mask once per session."""
+    return load_land_sea_mask()
+
+
+@pytest.fixture(scope="session")
+def kit_spec():
+    """Load the 31203 kit specification once per session."""
+    return load_kit_specification("31203")
+
+
+@pytest.fixture(scope="session")
+def quantizer(palette):
+    """Create a color quantizer over the default palette once per session."""
+    return ColorQuantizer(palette)
+
+
+@pytest.fixture(scope="session")
+def generator(palette, land_sea_mask):
+    """Create a layout generator once per session (it holds no per-layout state)."""
+    return LayoutGenerator(palette=palette, land_sea_mask=land_sea_mask)
+
+
+@pytest.fixture(scope="session")
+def validator(kit_spec, palette):
+    """Create a layout validator once per session (it holds no per-layout state)."""
+    return LayoutValidator(kit_spec=kit_spec, palette=palette)
+
+
+@pytest.fixture(scope="session")
+def solid_image(palette):
+    """Return a fresh copy of a cached 128x80 image filled with a named palette color."""
+    cache = {}
+
+    def _get(color_name):
+        if color_name not in cache:
+            cache[color_name] = Image.new("RGB", (128, 80), palette.get_by_name(color_name).rgb)
+        return cache[color_name].copy()
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def solid_layout(generator, solid_image):
+    """Return a cached 128x80 layout filled with a single named palette color.
+
+    Layouts are generated on first request per color and reused for the rest
+    of the session, so callers must not modify the returned grid.
+    """
+    cache = {}
+
+    def _get(color_name):
+        if color_name not in cache:
+            cache[color_name] = generator.generate(
+                solid_image(color_name), source_filename="test.png"
+            )
+        return cache[color_name]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def expected_stats():
+    """Return a helper that computes reference ColorStatistics with np.unique."""
+    def _compute(img, palette):
+        pixels = np.asarray(img.convert("RGB")).reshape(-1, 3)
+        uniq, counts = np.unique(pixels, axis=0, return_counts=True)
+        color_counts = Counter(dict(zip(map(tuple, uniq.tolist()), counts.tolist())))
+
+        palette_rgb = {tuple(c.rgb) for c in palette.colors}
+        lego = [count for rgb, count in color_counts.items() if rgb in palette_rgb]
+        total = len(pixels)
+
+        return ColorStatistics(
+            total_pixels=total,
+            unique_colors=len(color_counts),
+            color_counts=color_counts,
+            lego_colors_found=len(lego),
+            lego_coverage_percent=sum(lego) / total * 100 if total > 0 else 0
+        )
+
+    return _compute
@@ -3,103 +3,120 @@
 import json
 import pytest
 from pathlib import Path
-from click.testing import CliRunner
 
 from lego_image_processor.cli.main import cli
 
 
+# Path to test layout file
+LAYOUT_FILE = Path(__file__).parent.parent / "fixtures" / "layouts" / "expected_test_128x80.json"
+
+
+@pytest.fixture(scope="module")
+def validated_report(runner, tmp_path_factory):
+    """Run the validate command once and return the parsed JSON report."""
+    output_file = tmp_path_factory.mktemp("validate") / "report.json"
+
+    result = runner.invoke(cli, [
+        "validate",
+        str(LAYOUT_FILE),
+        "-o", str(output_file)
+    ], catch_exceptions=False)
+
+    assert result.exit_code == 0, f"CLI failed: {result.output}"
+
+    with open(output_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _check_top_level(report):
+    """Validation report JSON matches expected schema."""
+    # Check required top-level fields
+    assert "buildable" in report
+    assert "buildability_score" in report
+    assert "violations" in report
+    assert "validated_at" in report
+    assert "kit_id" in report
+    assert "layout_file" in report
+
+    # Check field types
+    assert isinstance(report["buildable"], bool)
+    assert isinstance(report["buildability_score"], (int, float))
+    assert isinstance(report["violations"], list)
+    assert isinstance(report["validated_at"], str)
+    assert isinstance(report["kit_id"], str)
+    assert isinstance(report["layout_file"], str)
+
+    # Check score range
+    assert 0.0 <= report["buildability_score"] <= 1.0
+
+    # Check timestamp format (ISO 8601)
+    assert "T" in report["validated_at"]
+
+
+def _check_violations_shape(report):
+    """Violation objects match expected schema."""
+    for violation in report["violations"]:
+        # All violations must have these fields
+        assert "type" in violation
+        assert violation["type"] in ["color_unavailable", "quantity_exceeded"]
+        assert "part_type" in violation
+        assert violation["part_type"] in ["brick", "tile"]
+        assert "part_id" in violation
+        assert "color_id" in violation
+        assert "color_name" in violation
+        assert "positions_required" in violation
+
+        if violation["type"] == "color_unavailable":
+            # May have suggested_alternative
+            if "suggested_alternative" in violation and violation["suggested_alternative"]:
+                alt = violation["suggested_alternative"]
+                assert "color_id" in alt
+                assert "color_name" in alt
+                assert "color_distance" in alt
+
+        elif violation["type"] == "quantity_exceeded":
+            assert "kit_quantity" in violation
+            assert "shortfall" in violation
+
+
+def _check_buildable_consistency(report):
+    """buildable=true implies no critical violations."""
+    if report["buildable"]:
+        # If buildable, score should be 1.0
+        assert report["buildability_score"] == 1.0
+        # No violations should exist
+        assert len(report["violations"]) == 0
+
+
+def _check_violations_score(report):
+    """Violations reduce buildability."""
+    if len(report["violations"]) > 0:
+        # Should not be fully buildable
+        assert not report["buildable"]
+        # Score should be less than 1.0
+        assert report["buildability_score"] < 1.0
+
+
 class TestValidateContractOutput:
     """Tests that validate command output matches expected contract."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @pytest.fixture
     def layout_file(self):
         """Path to test layout file."""
-        return Path(__file__).parent.parent / "fixtures" / "layouts" / "expected_test_128x80.json"
+        return LAYOUT_FILE
 
-    def test_validate_json_output_schema(self, runner, layout_file, tmp_path):
-        """Test that validation report JSON matches expected schema."""
-        output_file = tmp_path / "report.json"
-
-        result = runner.invoke(cli, [
-            "validate",
-            str(layout_file),
-            "-o", str(output_file)
-        ])
-
-        assert result.exit_code == 0, f"CLI failed: {result.output}"
-        assert output_file.exists()
-
-        with open(output_file, "r", encoding="utf-8") as f:
-            report = json.load(f)
-
-        # Check required top-level fields
-        assert "buildable" in report
-        assert "buildability_score" in report
-        assert "violations" in report
-        assert "validated_at" in report
-        assert "kit_id" in report
-        assert "layout_file" in report
-
-        # Check field types
-        assert isinstance(report["buildable"], bool)
-        assert isinstance(report["buildability_score"], (int, float))
-        assert isinstance(report["violations"], list)
-        assert isinstance(report["validated_at"], str)
-        assert isinstance(report["kit_id"], str)
-        assert isinstance(report["layout_file"], str)
-
-        # Check score range
-        assert 0.0 <= report["buildability_score"] <= 1.0
-
-        # Check timestamp format (ISO 8601)
-        assert "T" in report["validated_at"]
-
-    def test_validate_violation_schema(self, runner, layout_file, tmp_path):
-        """Test that violation objects match expected schema."""
-        output_file = tmp_path / "report.json"
-
-        result = runner.invoke(cli, [
-            "validate",
-            str(layout_file),
-            "-o", str(output_file)
-        ])
-
-        assert result.exit_code == 0
-
-        with open(output_file, "r", encoding="utf-8") as f:
-            report = json.load(f)
-
-        for violation in report["violations"]:
-            # All violations must have these fields
-            assert "type" in violation
-            assert violation["type"] in ["color_unavailable", "quantity_exceeded"]
-            assert "part_type" in violation
-            assert violation["part_type"] in ["brick", "tile"]
-            assert "part_id" in violation
-            assert "color_id" in violation
-            assert "color_name" in violation
-            assert "positions_required" in violation
-
-            if violation["type"] == "color_unavailable":
-                # May have suggested_alternative
-                if "suggested_alternative" in violation and violation["suggested_alternative"]:
-                    alt = violation["suggested_alternative"]
-                    assert "color_id" in alt
-                    assert "color_name" in alt
-                    assert "color_distance" in alt
-
-            elif violation["type"] == "quantity_exceeded":
-                assert "kit_quantity" in violation
-                assert "shortfall" in violation
+    @pytest.mark.parametrize(
+        "check",
+        [_check_top_level, _check_violations_shape],
+        ids=["top_level", "violations_shape"]
+    )
+    def test_validate_report_schema(self, validated_report, check):
+        """Test that the validation report JSON matches the expected schema."""
+        check(validated_report)
 
     def test_validate_cli_output_format(self, runner, layout_file):
         """Test that CLI output has expected format."""
-        result = runner.invoke(cli, ["validate", str(layout_file)])
+        result = runner.invoke(cli, ["validate", str(layout_file)], catch_exceptions=False)
 
         assert result.exit_code == 0
 
@@ -122,7 +139,7 @@ class TestValidateContractOutput:
             str(layout_file),
             "--kit", "31203",
             "-o", str(output_file)
-        ])
+        ], catch_exceptions=False)
 
         assert result.exit_code == 0
 
@@ -150,54 +167,11 @@ class TestValidateContractOutput:
 class TestValidateReportConsistency:
     """Tests for validation report consistency."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def layout_file(self):
-        """Path to test layout file."""
-        return Path(__file__).parent.parent / "fixtures" / "layouts" / "expected_test_128x80.json"
-
-    def test_buildable_implies_no_blocking_violations(self, runner, layout_file, tmp_path):
-        """Test that buildable=true implies no critical violations."""
-        output_file = tmp_path / "report.json"
-
-        result = runner.invoke(cli, [
-            "validate",
-            str(layout_file),
-            "-o", str(output_file)
-        ])
-
-        assert result.exit_code == 0
-
-        with open(output_file, "r", encoding="utf-8") as f:
-            report = json.load(f)
-
-        if report["buildable"]:
-            # If buildable, score should be 1.0
-            assert report["buildability_score"] == 1.0
-            # No violations should exist
-            assert len(report["violations"]) == 0
-
-    def test_violations_imply_not_fully_buildable(self, runner, layout_file, tmp_path):
-        """Test that violations reduce buildability."""
-        output_file = tmp_path / "report.json"
-
-        result = runner.invoke(cli, [
-            "validate",
-            str(layout_file),
-            "-o", str(output_file)
-        ])
-
-        assert result.exit_code == 0
-
-        with open(output_file, "r", encoding="utf-8") as f:
-            report = json.load(f)
-
-        if len(report["violations"]) > 0:
-            # Should not be fully buildable
-            assert not report["buildable"]
-            # Score should be less than 1.0
-            assert report["buildability_score"] < 1.0
+    @pytest.mark.parametrize(
+        "check",
+        [_check_buildable_consistency, _check_violations_score],
+        ids=["buildable_implies_no_violations", "violations_imply_not_buildable"]
+    )
+    def test_validate_report_consistency(self, validated_report, check):
+        """Test that buildable flag, score and violations agree."""
+        check(validated_report)
@@ -1,31 +1,36 @@
 """Integration tests for CLI commands."""
 
+import io
 import pytest
 import tempfile
 import os
 from pathlib import Path
 from PIL import Image
-from click.testing import CliRunner
 
 from lego_image_processor.cli.main import cli
 
 
+def _encode_png(size, color):
+    """Encode a solid-color RGB image as PNG bytes."""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
 class TestQuantizeCommand:
     """Integration tests for quantize command."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
+    @pytest.fixture(scope="class")
+    def png_bytes(self):
+        """Encode the test image once for the whole class."""
+        return _encode_png((100, 100), (200, 50, 50))
 
     @pytest.fixture
-    def temp_image(self):
-        """Create a temporary test image."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            img = Image.new("RGB", (100, 100), color=(200, 50, 50))
-            img.save(f.name)
-            yield Path(f.name)
-        os.unlink(f.name)
+    def temp_image(self, png_bytes, tmp_path):
+        """Write the pre-encoded test image to a temporary file."""
+        path = tmp_path / "input.png"
+        path.write_bytes(png_bytes)
+        return path
 
     @pytest.fixture
     def temp_dir(self):
@@ -38,18 +43,17 @@ class TestQuantizeCommand:
         output_path = temp_dir / "output.png"
         result = runner.invoke(cli, [
             "quantize", str(temp_image), "-o", str(output_path)
-        ])
+        ], catch_exceptions=False)
 
         assert result.exit_code == 0, f"CLI error: {result.output}"
-        assert output_path.exists()
 
         # Verify output is valid image
-        img = Image.open(output_path)
-        assert img.size == (100, 100)
+        with Image.open(output_path) as img:
+            assert img.size == (100, 100)
 
     def test_quantize_default_output(self, runner, temp_image):
         """Test quantize with default output path."""
-        result = runner.invoke(cli, ["quantize", str(temp_image)])
+        result = runner.invoke(cli, ["quantize", str(temp_image)], catch_exceptions=False)
 
         assert result.exit_code == 0
 
@@ -63,7 +67,7 @@ class TestQuantizeCommand:
         output_path = temp_dir / "output.png"
         result = runner.invoke(cli, [
             "quantize", str(temp_image), "-o", str(output_path), "-v"
-        ])
+        ], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Loading image" in result.output
@@ -81,7 +85,7 @@ class TestQuantizeCommand:
             "quantize", str(temp_image),
             "-o", str(output_path),
             "-q", "50"
-        ])
+        ], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert output_path.exists()
@@ -90,23 +94,21 @@ class TestQuantizeCommand:
 class TestStatsCommand:
     """Integration tests for stats command."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
+    @pytest.fixture(scope="class")
+    def png_bytes(self):
+        """Encode the test image once for the whole class."""
+        return _encode_png((50, 50), (255, 255, 255))
 
     @pytest.fixture
-    def temp_image(self):
-        """Create a temporary test image."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            img = Image.new("RGB", (50, 50), color=(255, 255, 255))
-            img.save(f.name)
-            yield Path(f.name)
-        os.unlink(f.name)
+    def temp_image(self, png_bytes, tmp_path):
+        """Write the pre-encoded test image to a temporary file."""
+        path = tmp_path / "input.png"
+        path.write_bytes(png_bytes)
+        return path
 
     def test_stats_basic(self, runner, temp_image):
         """Test basic stats command."""
-        result = runner.invoke(cli, ["stats", str(temp_image)])
+        result = runner.invoke(cli, ["stats", str(temp_image)], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "File:" in result.output
@@ -115,7 +117,7 @@ class TestStatsCommand:
 
     def test_stats_json(self, runner, temp_image):
         """Test stats with JSON output."""
-        result = runner.invoke(cli, ["stats", str(temp_image), "--json"])
+        result = runner.invoke(cli, ["stats", str(temp_image), "--json"], catch_exceptions=False)
 
         assert result.exit_code == 0
 
@@ -127,7 +129,7 @@ class TestStatsCommand:
 
     def test_stats_top_colors(self, runner, temp_image):
         """Test stats with top N colors."""
-        result = runner.invoke(cli, ["stats", str(temp_image), "-n", "5"])
+        result = runner.invoke(cli, ["stats", str(temp_image), "-n", "5"], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Top 5 colors" in result.output
@@ -141,14 +143,9 @@ class TestStatsCommand:
 class TestMainCli:
     """Tests for main CLI group."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
     def test_help(self, runner):
         """Test --help flag."""
-        result = runner.invoke(cli, ["--help"])
+        result = runner.invoke(cli, ["--help"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "LEGO Image Processor" in result.output
         assert "quantize" in result.output
@@ -156,18 +153,18 @@ class TestMainCli:
 
     def test_version(self, runner):
         """Test --version flag."""
-        result = runner.invoke(cli, ["--version"])
+        result = runner.invoke(cli, ["--version"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
     def test_quantize_help(self, runner):
         """Test quantize --help."""
-        result = runner.invoke(cli, ["quantize", "--help"])
+        result = runner.invoke(cli, ["quantize", "--help"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "Quantize an image" in result.output
 
     def test_stats_help(self, runner):
         """Test stats --help."""
-        result = runner.invoke(cli, ["stats", "--help"])
+        result = runner.invoke(cli, ["stats", "--help"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "color statistics" in result.output
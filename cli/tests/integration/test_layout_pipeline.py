@@ -2,13 +2,11 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 from PIL import Image
 
-from lego_image_processor.layout.generator import LayoutGenerator
-from lego_image_processor.layout.land_sea_mask import load_land_sea_mask
 from lego_image_processor.layout.grid import PositionPlacementGrid
-from lego_image_processor.palette.loader import LegoPalette
 
 
 # Get path to test fixtures
@@ -20,25 +18,9 @@ class TestLayoutPipeline:
     """Integration tests for complete layout generation workflow."""
 
     @pytest.fixture
-    def palette(self):
-        """Load the default LEGO palette."""
-        return LegoPalette.load_default()
-
-    @pytest.fixture
-    def land_sea_mask(self):
-        """Load the land/sea mask."""
-        return load_land_sea_mask()
-
-    @pytest.fixture
-    def generator(self, palette, land_sea_mask):
-        """Create a LayoutGenerator instance."""
-        return LayoutGenerator(palette=palette, land_sea_mask=land_sea_mask)
-
-    @pytest.fixture
-    def test_image(self, palette):
+    def test_image(self, palette, solid_image):
         """Create a valid test image."""
-        first_color = palette.colors[0]
-        return Image.new("RGB", (128, 80), first_color.rgb)
+        return solid_image(palette.colors[0].name)
 
     def test_full_pipeline_generates_correct_position_count(self, generator, test_image):
         """Test that full pipeline generates 10,240 positions."""
@@ -49,41 +31,43 @@ class TestLayoutPipeline:
         """Test that pipeline generates exactly 3,062 land bricks."""
         grid = generator.generate(test_image, source_filename="test.png")
 
-        brick_count = sum(1 for p in grid.positions if p.part_type == "brick")
-        assert brick_count == 3062
+        _, _, part_types, _ = grid.as_soa
+        assert (part_types == "brick").sum() == 3062
 
     def test_full_pipeline_correct_ocean_tile_count(self, generator, test_image):
         """Test that pipeline generates exactly 7,178 ocean tiles."""
         grid = generator.generate(test_image, source_filename="test.png")
 
-        tile_count = sum(1 for p in grid.positions if p.part_type == "tile")
-        assert tile_count == 7178
+        _, _, part_types, _ = grid.as_soa
+        assert (part_types == "tile").sum() == 7178
 
     def test_full_pipeline_correct_part_ids(self, generator, test_image):
         """Test that bricks use 3062b and tiles use 98138."""
         grid = generator.generate(test_image, source_filename="test.png")
 
-        for pos in grid.positions:
-            if pos.part_type == "brick":
-                assert pos.lego_part_id == "3062b"
-            else:
-                assert pos.lego_part_id == "98138"
+        _, _, part_types, part_ids = grid.as_soa
+
+        assert ((part_types == "brick") == (part_ids == "3062b")).all()
+        assert ((part_types == "tile") == (part_ids == "98138")).all()
 
     def test_full_pipeline_valid_coordinates(self, generator, test_image):
         """Test that all positions have valid coordinates."""
         grid = generator.generate(test_image, source_filename="test.png")
 
-        for pos in grid.positions:
-            assert 0 <= pos.x < 128
-            assert 0 <= pos.y < 80
+        xs, ys, _, _ = grid.as_soa
+
+        assert (xs >= 0).all() and (xs < 128).all()
+        assert (ys >= 0).all() and (ys < 80).all()
 
     def test_full_pipeline_all_coordinates_covered(self, generator, test_image):
         """Test that every coordinate has a position."""
         grid = generator.generate(test_image, source_filename="test.png")
 
-        coords = set((p.x, p.y) for p in grid.positions)
-        expected_coords = set((x, y) for y in range(80) for x in range(128))
-        assert coords == expected_coords
+        xs, ys, _, _ = grid.as_soa
+        covered = np.zeros((80, 128), dtype=bool)
+        covered[ys, xs] = True
+        assert len(xs) == 10240
+        assert covered.all()
 
     def test_full_pipeline_colors_preserved(self, generator, palette):
         """Test that colors from input image are preserved."""
@@ -151,8 +135,8 @@ class TestLayoutPipeline:
         if not fixture_path.exists():
             pytest.skip("Fixture image not available")
 
-        image = Image.open(fixture_path)
-        grid = generator.generate(image, source_filename=fixture_path.name)
+        with Image.open(fixture_path) as image:
+            grid = generator.generate(image, source_filename=fixture_path.name)
 
         assert grid.total_positions == 10240
         assert grid.land_positions == 3062
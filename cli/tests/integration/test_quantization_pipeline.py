@@ -6,65 +6,37 @@ from PIL import Image
 import tempfile
 from pathlib import Path
 
-from lego_image_processor.core.color_quantizer import ColorQuantizer
 from lego_image_processor.core.image_loader import load_image
 from lego_image_processor.core.image_writer import save_image
-from lego_image_processor.palette.loader import LegoPalette
 from lego_image_processor.analysis.color_stats import analyze_image
 
 
 class TestFullPipeline:
     """Integration tests for complete image processing pipeline."""
 
-    @pytest.fixture
-    def palette(self):
-        """Load the default LEGO palette."""
-        return LegoPalette.load_default()
-
-    @pytest.fixture
-    def quantizer(self, palette):
-        """Create a color quantizer."""
-        return ColorQuantizer(palette)
-
     @pytest.fixture
     def test_image(self):
         """Create a test image with various colors."""
-        img = Image.new("RGB", (100, 100))
-        pixels = img.load()
+        arr = np.empty((100, 100, 3), dtype=np.uint8)
 
         # Create quadrants with different colors
-        for y in range(100):
-            for x in range(100):
-                if x < 50 and y < 50:
-                    pixels[x, y] = (255, 0, 0)  # Red
-                elif x >= 50 and y < 50:
-                    pixels[x, y] = (0, 255, 0)  # Green
-                elif x < 50 and y >= 50:
-                    pixels[x, y] = (0, 0, 255)  # Blue
-                else:
-                    pixels[x, y] = (255, 255, 0)  # Yellow
-
-        return img
+        arr[:50, :50] = (255, 0, 0)  # Red
+        arr[:50, 50:] = (0, 255, 0)  # Green
+        arr[50:, :50] = (0, 0, 255)  # Blue
+        arr[50:, 50:] = (255, 255, 0)  # Yellow
+
+        return Image.fromarray(arr, mode="RGB")
 
     def test_load_quantize_save_pipeline(self, quantizer, test_image):
-        """Test full pipeline: load -> quantize -> save -> verify."""
+        """Test full pipeline: quantize -> save -> load -> verify."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Save test image
-            input_path = Path(temp_dir) / "input.png"
-            test_image.save(input_path)
-
-            # Load
-            loaded_image = load_image(input_path)
-            assert loaded_image.size == (100, 100)
-
             # Quantize
-            result = quantizer.quantize(loaded_image)
+            result = quantizer.quantize(test_image)
             assert result.image.size == (100, 100)
 
             # Save
             output_path = Path(temp_dir) / "output.png"
             save_image(result.image, output_path)
-            assert output_path.exists()
 
             # Verify output
             final_image = load_image(output_path)
@@ -73,23 +45,16 @@ class TestFullPipeline:
             # All colors should be LEGO colors
             assert stats.lego_coverage_percent == 100.0
 
-    def test_quantized_output_contains_only_lego_colors(self, quantizer, palette):
+    def test_quantized_output_contains_only_lego_colors(self, quantizer, palette_u32, pack_rgb, random_pixels):
         """Test that quantized images only contain LEGO colors."""
         # Create image with random colors
-        np.random.seed(42)
-        random_pixels = np.random.randint(0, 256, (50, 50, 3), dtype=np.uint8)
-        img = Image.fromarray(random_pixels, mode="RGB")
+        img = Image.fromarray(random_pixels(50), mode="RGB")
 
         # Quantize
         result = quantizer.quantize(img)
 
         # Verify all output colors are in palette
-        output_array = np.array(result.image)
-        unique_colors = set(map(tuple, output_array.reshape(-1, 3)))
-        palette_colors = set(c.rgb for c in palette.colors)
-
-        for color in unique_colors:
-            assert color in palette_colors
+        assert np.isin(pack_rgb(result.image), palette_u32).all()
 
     def test_color_mapping_accuracy(self, quantizer):
         """Test that color mapping is recorded accurately."""
@@ -105,29 +70,28 @@ class TestFullPipeline:
         output_array = np.array(result.image)
         assert np.all(output_array[0, 0] == list(mapped_color.rgb))
 
-    def test_large_image_processing(self, quantizer):
+    @pytest.mark.parametrize("size", [
+        256,
+        pytest.param(1024, marks=pytest.mark.slow),
+    ])
+    def test_large_image_processing(self, quantizer, random_pixels, size):
         """Test processing of larger images."""
-        # Create 1024x1024 image
-        np.random.seed(42)
-        large_pixels = np.random.randint(0, 256, (1024, 1024, 3), dtype=np.uint8)
-        img = Image.fromarray(large_pixels, mode="RGB")
+        img = Image.fromarray(random_pixels(size), mode="RGB")
 
         # Should complete without error
         result = quantizer.quantize(img)
-        assert result.image.size == (1024, 1024)
+        assert result.image.size == (size, size)
 
         # Verify output
         stats = analyze_image(result.image)
         assert stats.lego_coverage_percent == 100.0
 
-    def test_preserves_image_dimensions(self, quantizer):
+    @pytest.mark.parametrize("width,height", [(1, 1), (10, 20), (100, 50), (200, 200)])
+    def test_preserves_image_dimensions(self, quantizer, width, height):
         """Test that various image dimensions are preserved."""
-        dimensions = [(1, 1), (10, 20), (100, 50), (200, 200)]
-
-        for width, height in dimensions:
-            img = Image.new("RGB", (width, height), color=(128, 128, 128))
-            result = quantizer.quantize(img)
-            assert result.image.size == (width, height)
+        img = Image.new("RGB", (width, height), color=(128, 128, 128))
+        result = quantizer.quantize(img)
+        assert result.image.size == (width, height)
 
     def test_stats_after_quantization(self, quantizer, palette):
         """Test that stats reflect LEGO colors after quantization."""
@@ -147,11 +111,6 @@ class TestFullPipeline:
 class TestDifferentImageFormats:
     """Test processing different image formats."""
 
-    @pytest.fixture
-    def quantizer(self):
-        """Create a color quantizer."""
-        return ColorQuantizer()
-
     def test_process_rgba_image(self, quantizer):
         """Test processing RGBA image."""
         img = Image.new("RGBA", (50, 50), color=(255, 0, 0, 128))
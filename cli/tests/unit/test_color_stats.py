@@ -9,7 +9,6 @@ from lego_image_processor.analysis.color_stats import (
     ColorStatistics,
     analyze_image
 )
-from lego_image_processor.palette.loader import LegoPalette
 
 
 class TestColorStatistics:
@@ -74,11 +73,6 @@ class TestColorStatistics:
 class TestAnalyzeImage:
     """Tests for analyze_image function."""
 
-    @pytest.fixture
-    def palette(self):
-        """Load default palette."""
-        return LegoPalette.load_default()
-
     @pytest.fixture
     def solid_color_image(self, palette):
         """Create image with single LEGO color."""
@@ -92,44 +86,63 @@ class TestAnalyzeImage:
         # Use a color unlikely to be in palette
         return Image.new("RGB", (100, 100), color=(123, 45, 67))
 
-    def test_analyze_solid_color(self, solid_color_image, palette):
+    def test_analyze_solid_color(self, solid_color_image, palette, expected_stats):
         """Test analyzing solid color image."""
         stats = analyze_image(solid_color_image, palette)
+        assert stats == expected_stats(solid_color_image, palette)
         assert stats.total_pixels == 10000
         assert stats.unique_colors == 1
         assert stats.lego_colors_found == 1
         assert stats.lego_coverage_percent == 100.0
 
+    def test_analyze_solid_color_counts(self, palette):
+        """Test that solid color images report a single full count."""
+        img = Image.new("RGB", (50, 40), color=(123, 45, 67))
+        stats = analyze_image(img, palette)
+        assert stats.color_counts == Counter({(123, 45, 67): 2000})
+        assert stats.get_top_colors(1) == [((123, 45, 67), 2000)]
+
     def test_analyze_non_lego_image(self, non_lego_image, palette):
         """Test analyzing image with non-LEGO colors."""
         stats = analyze_image(non_lego_image, palette)
         assert stats.lego_colors_found == 0
         assert stats.lego_coverage_percent == 0.0
 
-    def test_analyze_multicolor_image(self, palette):
+    def test_analyze_multicolor_image(self, palette, gradient_image, expected_stats):
         """Test analyzing image with multiple colors."""
-        img = Image.new("RGB", (20, 20))
-        pixels = img.load()
-
-        # Fill with gradient
-        for y in range(20):
-            for x in range(20):
-                pixels[x, y] = (x * 12, y * 12, 128)
-
-        stats = analyze_image(img, palette)
+        stats = analyze_image(gradient_image, palette)
+        assert stats == expected_stats(gradient_image, palette)
         assert stats.total_pixels == 400
         assert stats.unique_colors > 1
 
-    def test_analyze_rgba_image(self, palette):
+    @pytest.mark.parametrize(
+        "colors",
+        [[(123, 45, 67)], [(123, 45, 67), (10, 20, 30)]],
+        ids=["solid", "two_colors"]
+    )
+    def test_color_count_keys_are_int_tuples(self, palette, colors):
+        """Test that both counting paths key color_counts by plain int tuples."""
+        img = Image.new("RGB", (len(colors), 1))
+        img.putdata(colors)
+        stats = analyze_image(img, palette)
+        assert set(stats.color_counts) == set(colors)
+        assert all(
+            type(rgb) is tuple and all(type(v) is int for v in rgb)
+            for rgb in stats.color_counts
+        )
+
+    def test_analyze_rgba_image(self, palette, expected_stats):
         """Test analyzing RGBA image."""
         img = Image.new("RGBA", (50, 50), color=(255, 255, 255, 255))
         stats = analyze_image(img, palette)
+        assert stats == expected_stats(img, palette)
         assert stats.total_pixels == 2500
 
-    def test_analyze_grayscale_image(self, palette):
+    def test_analyze_grayscale_image(self, palette, expected_stats):
         """Test analyzing grayscale image."""
         img = Image.new("L", (50, 50), color=128)
         stats = analyze_image(img, palette)
+        assert stats == expected_stats(img, palette)
         assert stats.total_pixels == 2500
 
     def test_analyze_with_default_palette(self):
@@ -48,6 +48,11 @@ class TestRgbToXyz:
         xyz = rgb_to_xyz(rgb)
         assert xyz.shape == (3, 3)
 
+    def test_uint8_matches_float(self):
+        """Test that uint8 input (gamma lookup table) matches float input exactly."""
+        rgb = np.arange(256, dtype=np.uint8).repeat(3).reshape(-1, 3)
+        np.testing.assert_array_equal(rgb_to_xyz(rgb), rgb_to_xyz(rgb.astype(np.float64)))
+
 
 class TestXyzToLab:
     """Tests for XYZ to LAB conversion."""
@@ -68,44 +73,43 @@ class TestXyzToLab:
         assert lab[0, 0] < 1  # L close to 0
 
 
-class TestRgbToLab:
-    """Tests for RGB to LAB conversion."""
+# Pure colors converted together by the pure_lab fixture
+PURE_COLORS = {
+    "white": (255, 255, 255),
+    "black": (0, 0, 0),
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+}
 
-    def test_white(self):
-        """Test converting white."""
-        rgb = np.array([[255, 255, 255]], dtype=np.float64)
-        lab = rgb_to_lab(rgb)
-        assert lab[0, 0] > 99  # L close to 100
 
-    def test_black(self):
-        """Test converting black."""
-        rgb = np.array([[0, 0, 0]], dtype=np.float64)
-        lab = rgb_to_lab(rgb)
-        assert lab[0, 0] < 1  # L close to 0
+@pytest.fixture(scope="module")
+def pure_lab():
+    """LAB value per PURE_COLORS name, from a single batched rgb_to_lab call."""
+    lab = rgb_to_lab(np.array(list(PURE_COLORS.values()), dtype=np.float64))
+    return dict(zip(PURE_COLORS, lab))
 
-    def test_pure_red(self):
-        """Test converting pure red."""
-        rgb = np.array([[255, 0, 0]], dtype=np.float64)
-        lab = rgb_to_lab(rgb)
-        assert lab[0, 1] > 0  # a* positive (red)
 
-    def test_pure_green(self):
-        """Test converting pure green."""
-        rgb = np.array([[0, 255, 0]], dtype=np.float64)
-        lab = rgb_to_lab(rgb)
-        assert lab[0, 1] < 0  # a* negative (green)
+class TestRgbToLab:
+    """Tests for RGB to LAB conversion."""
 
-    def test_pure_blue(self):
-        """Test converting pure blue."""
-        rgb = np.array([[0, 0, 255]], dtype=np.float64)
-        lab = rgb_to_lab(rgb)
-        assert lab[0, 2] < 0  # b* negative (blue)
+    @pytest.mark.parametrize("name,check", [
+        pytest.param("white", lambda lab: lab[0] > 99, id="white"),      # L close to 100
+        pytest.param("black", lambda lab: lab[0] < 1, id="black"),       # L close to 0
+        pytest.param("red", lambda lab: lab[1] > 0, id="pure_red"),      # a* positive
+        pytest.param("green", lambda lab: lab[1] < 0, id="pure_green"),  # a* negative
+        pytest.param("blue", lambda lab: lab[2] < 0, id="pure_blue"),    # b* negative
+        pytest.param("yellow", lambda lab: lab[2] > 0, id="pure_yellow"),  # b* positive
+    ])
+    def test_pure_colors(self, pure_lab, name, check):
+        """Test LAB values of pure colors, converted in one batch."""
+        assert check(pure_lab[name])
 
-    def test_pure_yellow(self):
-        """Test converting pure yellow."""
-        rgb = np.array([[255, 255, 0]], dtype=np.float64)
-        lab = rgb_to_lab(rgb)
-        assert lab[0, 2] > 0  # b* positive (yellow)
+    def test_matches_two_stage_conversion(self):
+        """Test that rgb_to_lab agrees with rgb_to_xyz followed by xyz_to_lab."""
+        rgb = np.random.default_rng(0).uniform(0, 255, (100, 3))
+        np.testing.assert_allclose(rgb_to_lab(rgb), xyz_to_lab(rgb_to_xyz(rgb)), atol=1e-9)
 
 
 class TestLabToRgb:
@@ -127,13 +131,18 @@ class TestLabToRgb:
 
         np.testing.assert_array_almost_equal(colors, rgb_back, decimal=0)
 
+    def test_matches_two_stage_conversion(self):
+        """Test that lab_to_rgb agrees with lab_to_xyz followed by xyz_to_rgb."""
+        lab = rgb_to_lab(np.random.default_rng(0).uniform(0, 255, (100, 3)))
+        np.testing.assert_allclose(lab_to_rgb(lab), xyz_to_rgb(lab_to_xyz(lab)), atol=1e-9)
+
     def test_roundtrip_random_colors(self):
         """Test roundtrip with random colors."""
-        np.random.seed(42)
-        colors = np.random.randint(0, 256, size=(100, 3)).astype(np.float64)
+        rng = np.random.default_rng(42)
+        colors = rng.integers(0, 256, size=(100, 3)).astype(np.float64)
 
         lab = rgb_to_lab(colors)
         rgb_back = lab_to_rgb(lab)
 
         # Allow for small rounding errors
-        np.testing.assert_array_almost_equal(colors, rgb_back, decimal=0)
+        np.testing.assert_allclose(rgb_back, colors, atol=1.0)
@@ -4,6 +4,7 @@ import json
 import pytest
 from datetime import datetime
 
+from lego_image_processor.core import json_codec
 from lego_image_processor.layout.position import PositionPlacement
 from lego_image_processor.layout.grid import PositionPlacementGrid, LayoutStatistics
 
@@ -140,6 +141,25 @@ class TestPositionPlacementGrid:
         assert len(grid.positions) == 1
         assert grid.get_position(0, 0) == pos
 
+    def test_as_soa(self, sample_positions):
+        """Test column arrays match positions and refresh after add_position."""
+        grid = PositionPlacementGrid(
+            width=2, height=3, positions=sample_positions, source_image="test.png"
+        )
+        xs, ys, part_types, part_ids = grid.as_soa
+        assert xs.tolist() == [0, 1, 0, 1]
+        assert ys.tolist() == [0, 0, 1, 1]
+        assert part_types.tolist() == ["tile", "tile", "brick", "brick"]
+        assert part_ids.tolist() == ["98138", "98138", "3062b", "3062b"]
+
+        grid.add_position(PositionPlacement(
+            x=0, y=2, color_id="lego_blue", color_name="Blue",
+            lego_color_code="23", part_type="tile", lego_part_id="98138"
+        ))
+        xs, ys, _, _ = grid.as_soa
+        assert len(xs) == 5
+        assert ys[-1] == 2
+
     def test_compute_statistics(self, sample_positions):
         """Test computing layout statistics."""
         grid = PositionPlacementGrid(
@@ -156,6 +176,20 @@ class TestPositionPlacementGrid:
         assert stats.color_frequency_by_part_type["brick"]["lego_green"] == 2
         assert stats.color_frequency_by_part_type["tile"]["lego_blue"] == 2
 
+        # Ties resolve to the first color seen, in position order
+        assert list(stats.color_frequency) == ["lego_blue", "lego_green"]
+        assert stats.most_common_color == {"color_id": "lego_blue", "color_name": "Blue", "count": 2}
+
+    def test_color_counts_by_part_type(self, sample_positions):
+        """Test per-part-type color counts carry names in first-seen order."""
+        grid = PositionPlacementGrid(
+            width=2, height=2, positions=sample_positions, source_image="test.png"
+        )
+        assert grid.color_counts_by_part_type() == {
+            "brick": [("lego_green", "Green", 2)],
+            "tile": [("lego_blue", "Blue", 2)]
+        }
+
     def test_to_json(self, sample_positions):
         """Test serializing grid to JSON string."""
         grid = PositionPlacementGrid(
@@ -208,6 +242,18 @@ class TestPositionPlacementGrid:
         assert restored_grid.ocean_positions == original_grid.ocean_positions
         assert len(restored_grid.positions) == len(original_grid.positions)
 
+    def test_to_json_non_ascii_source_same_without_orjson(self, sample_positions, monkeypatch):
+        """Test that a non-ASCII source filename serializes the same on both JSON paths."""
+        grid = PositionPlacementGrid(
+            width=2, height=2, positions=sample_positions, source_image="mapa_del_año.png"
+        )
+        json_str = grid.to_json()
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+        assert grid.to_json() == json_str
+        assert '"source_image": "mapa_del_año.png"' in json_str
+        assert PositionPlacementGrid.from_json(json_str).source_image == "mapa_del_año.png"
+
     def test_total_positions_invariant(self, sample_positions):
         """Test that total_positions equals width * height."""
         grid = PositionPlacementGrid(
@@ -3,8 +3,6 @@
 import pytest
 from pathlib import Path
 from PIL import Image
-import tempfile
-import os
 
 from lego_image_processor.core.image_loader import (
     load_image,
@@ -18,23 +16,19 @@ from lego_image_processor.core.image_loader import (
 class TestLoadImage:
     """Tests for load_image function."""
 
-    @pytest.fixture
-    def temp_png(self):
-        """Create a temporary PNG file."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            img = Image.new("RGB", (100, 100), color=(255, 0, 0))
-            img.save(f.name)
-            yield Path(f.name)
-        os.unlink(f.name)
-
-    @pytest.fixture
-    def temp_jpg(self):
-        """Create a temporary JPEG file."""
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            img = Image.new("RGB", (100, 100), color=(0, 255, 0))
-            img.save(f.name, "JPEG")
-            yield Path(f.name)
-        os.unlink(f.name)
+    @pytest.fixture(scope="module")
+    def temp_png(self, tmp_path_factory):
+        """Create a PNG file once per module (load_image only reads it)."""
+        path = tmp_path_factory.mktemp("images") / "image.png"
+        Image.new("RGB", (100, 100), color=(255, 0, 0)).save(path)
+        return path
+
+    @pytest.fixture(scope="module")
+    def temp_jpg(self, tmp_path_factory):
+        """Create a JPEG file once per module (load_image only reads it)."""
+        path = tmp_path_factory.mktemp("images") / "image.jpg"
+        Image.new("RGB", (100, 100), color=(0, 255, 0)).save(path, "JPEG")
+        return path
 
     def test_load_png(self, temp_png):
         """Test loading PNG image."""
@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 from PIL import Image
+import shutil
 import tempfile
 import os
 
@@ -16,9 +17,9 @@ from lego_image_processor.core.image_writer import (
 class TestSaveImage:
     """Tests for save_image function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_image(self):
-        """Create a sample RGB image."""
+        """Create a sample RGB image shared by the module (save_image never mutates it)."""
         return Image.new("RGB", (100, 100), color=(255, 0, 0))
 
     @pytest.fixture
@@ -31,11 +32,10 @@ class TestSaveImage:
         """Test saving PNG image."""
         output_path = temp_dir / "output.png"
         save_image(sample_image, output_path)
-        assert output_path.exists()
 
         # Verify it can be loaded back
-        loaded = Image.open(output_path)
-        assert loaded.size == (100, 100)
+        with Image.open(output_path) as loaded:
+            assert loaded.size == (100, 100)
 
     def test_save_jpeg(self, sample_image, temp_dir):
         """Test saving JPEG image."""
@@ -56,12 +56,47 @@ class TestSaveImage:
         # Higher quality should result in larger file
         assert high_quality.stat().st_size > low_quality.stat().st_size
 
+    def test_save_jpeg_progressive(self, sample_image, temp_dir):
+        """Test that JPEGs are progressive unless saving fast."""
+        progressive = temp_dir / "progressive.jpg"
+        baseline = temp_dir / "baseline.jpg"
+
+        save_image(sample_image, progressive)
+        save_image(sample_image, baseline, fast=True)
+
+        with Image.open(progressive) as loaded:
+            assert loaded.info.get("progressive")
+        with Image.open(baseline) as loaded:
+            assert not loaded.info.get("progressive")
+
+    def test_save_png_compress_level(self, temp_dir):
+        """Test that higher PNG compression does not grow the file."""
+        image = Image.linear_gradient("L").convert("RGB").resize((100, 100))
+        fast = temp_dir / "fast.png"
+        archival = temp_dir / "archival.png"
+
+        save_image(image, fast, fast=True)
+        save_image(image, archival, compress_level=9)
+
+        assert archival.stat().st_size <= fast.stat().st_size
+        with Image.open(fast) as loaded:
+            assert loaded.size == (100, 100)
+
     def test_save_creates_directories(self, sample_image, temp_dir):
         """Test that save creates parent directories."""
         output_path = temp_dir / "nested" / "dir" / "output.png"
         save_image(sample_image, output_path)
         assert output_path.exists()
 
+    def test_save_recreates_removed_directory(self, sample_image, temp_dir):
+        """Test that a directory removed between saves is created again."""
+        output_path = temp_dir / "nested" / "output.png"
+        save_image(sample_image, output_path)
+        shutil.rmtree(output_path.parent)
+
+        save_image(sample_image, output_path)
+        assert output_path.exists()
+
     def test_save_rgba_as_jpeg(self, temp_dir):
         """Test saving RGBA image as JPEG (should convert)."""
         rgba_image = Image.new("RGBA", (100, 100), color=(255, 0, 0, 255))
@@ -69,8 +104,17 @@ class TestSaveImage:
         save_image(rgba_image, output_path)
 
         # JPEG doesn't support alpha, should be converted
-        loaded = Image.open(output_path)
-        assert loaded.mode == "RGB"
+        with Image.open(output_path) as loaded:
+            assert loaded.mode == "RGB"
+
+    def test_save_transparent_rgba_as_jpeg(self, temp_dir):
+        """Test that transparent areas are composited onto white for JPEG."""
+        rgba_image = Image.new("RGBA", (100, 100), color=(255, 0, 0, 0))
+        output_path = temp_dir / "output.jpg"
+        save_image(rgba_image, output_path)
+
+        with Image.open(output_path) as loaded:
+            assert all(channel >= 250 for channel in loaded.getpixel((50, 50)))
 
     def test_save_with_string_path(self, sample_image, temp_dir):
         """Test saving with string path."""
@@ -114,3 +158,8 @@ class TestGetOutputPath:
         """Test with relative path."""
         result = get_output_path("images/photo.png")
         assert result == Path("images/photo_lego.png")
+
+    def test_trailing_dot_and_slash(self):
+        """Test that names follow Path stem/suffix rules at the edges."""
+        assert get_output_path("photo.") == Path("photo._lego")
+        assert get_output_path("out/") == Path("out_lego")
@@ -0,0 +1,60 @@
+"""Unit tests for JSON codec helpers."""
+
+import json
+
+import pytest
+
+from lego_image_processor.core import json_codec
+
+
+class TestJsonCodec:
+    """Tests for json_codec dumps/loads."""
+
+    @pytest.fixture
+    def sample(self):
+        """Sample document with nested containers and floats."""
+        return {"metadata": {"width": 128, "name": "Earth Blue"}, "values": [1, 2.5, True, None]}
+
+    def test_dumps_indent_matches_stdlib(self, sample):
+        """Test that indented output matches json.dumps byte-for-byte."""
+        assert json_codec.dumps(sample) == json.dumps(sample, indent=2)
+
+    def test_dumps_other_indent(self, sample):
+        """Test that unsupported indents fall back to the standard library."""
+        assert json_codec.dumps(sample, indent=4) == json.dumps(sample, indent=4)
+
+    def test_dumps_compact_roundtrip(self, sample):
+        """Test compact output parses back to the same data."""
+        assert json.loads(json_codec.dumps(sample, indent=None)) == sample
+
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_dumps_same_without_orjson(self, sample, monkeypatch, indent):
+        """Test that the standard library fallback writes the same text as orjson."""
+        sample["metadata"]["source_filename"] = "mapa_del_año.png"
+        expected = json_codec.dumps(sample, indent=indent)
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+        assert json_codec.dumps(sample, indent=indent) == expected
+        assert "mapa_del_año.png" in expected
+
+    def test_dumps_floats_equivalent_without_orjson(self, monkeypatch):
+        """Test that floats read back equal on both paths, and match in plain notation."""
+        plain = {"score": 0.75, "coverage": 29.912109375, "distance": 10.57}
+        extreme = {"small": 1e-05, "large": 1e16}
+        expected_plain = json_codec.dumps(plain)
+        expected_extreme = json_codec.dumps(extreme)
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+        assert json_codec.dumps(plain) == expected_plain
+        assert json.loads(json_codec.dumps(extreme)) == json.loads(expected_extreme) == extreme
+
+    def test_loads_roundtrip(self, sample):
+        """Test parsing str and bytes documents."""
+        text = json.dumps(sample)
+        assert json_codec.loads(text) == sample
+        assert json_codec.loads(text.encode("utf-8")) == sample
+
+    def test_loads_invalid_raises_json_decode_error(self):
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads("{ invalid json }")
@@ -1,5 +1,6 @@
 """Unit tests for LEGOWorldMapKitSpecification class."""
 
+import json
 import pytest
 
 from lego_image_processor.layout.kit_spec import (
@@ -55,6 +56,13 @@ class TestLEGOWorldMapKitSpecification:
         # A made-up color should not be available
         assert not kit.is_tile_color_available("lego_nonexistent_color")
 
+    def test_color_availability_matches_color_lists(self):
+        """Test that availability checks agree with the available color lists."""
+        kit = load_kit_specification("31203")
+        for color_id in set(kit.available_colors_brick) | set(kit.available_colors_tile):
+            assert kit.is_brick_color_available(color_id) == (color_id in kit.available_colors_brick)
+            assert kit.is_tile_color_available(color_id) == (color_id in kit.available_colors_tile)
+
     def test_get_brick_quantity(self):
         """Test getting brick quantity."""
         kit = load_kit_specification("31203")
@@ -76,6 +84,19 @@ class TestLEGOWorldMapKitSpecification:
         with pytest.raises(ValueError, match="not supported"):
             load_kit_specification("99999")
 
+    def test_load_kit_specification_is_cached(self):
+        """Test that repeated loads share one specification instance."""
+        assert load_kit_specification("31203") is load_kit_specification("31203")
+
+    def test_kit_specification_is_immutable(self):
+        """Test that a loaded specification cannot be modified."""
+        kit = load_kit_specification("31203")
+        with pytest.raises(AttributeError):
+            kit.kit_name = "Modified"
+        with pytest.raises(TypeError):
+            kit.brick_quantities["lego_white"] = 0
+        assert isinstance(kit.available_colors_brick, tuple)
+
     def test_to_dict(self):
         """Test converting kit spec to dictionary."""
         kit = load_kit_specification("31203")
@@ -87,9 +108,14 @@ class TestLEGOWorldMapKitSpecification:
 
     def test_from_json(self):
         """Test creating kit spec from JSON."""
-        import json
         kit = load_kit_specification("31203")
         json_str = json.dumps(kit.to_dict())
         restored = LEGOWorldMapKitSpecification.from_json(json_str)
         assert restored.kit_id == kit.kit_id
         assert restored.base_plate_width == kit.base_plate_width
+
+    def test_from_json_reuses_instance(self):
+        """Test that identical JSON text yields the same specification."""
+        json_str = json.dumps(load_kit_specification("31203").to_dict())
+        first = LEGOWorldMapKitSpecification.from_json(json_str)
+        assert LEGOWorldMapKitSpecification.from_json(json_str) is first
@@ -1,8 +1,13 @@
 """Unit tests for LandSeaMask class and loader function."""
 
+import numpy as np
 import pytest
 
-from lego_image_processor.layout.land_sea_mask import LandSeaMask, load_land_sea_mask
+from lego_image_processor.layout.land_sea_mask import (
+    LandSeaMask,
+    load_land_sea_mask,
+    save_packed_mask
+)
 
 
 class TestLandSeaMask:
@@ -34,7 +39,18 @@ class TestLandSeaMask:
         assert 29.0 <= mask.land_percentage <= 30.0  # ~29.9%
         assert 70.0 <= mask.ocean_percentage <= 71.0  # ~70.1%
 
-    def test_is_land_ocean_position(self):
+    @pytest.fixture
+    def mask_arr(self, land_sea_mask):
+        """Default mask as a boolean (height, width) array."""
+        return land_sea_mask.as_array()
+
+    @staticmethod
+    def _first_position(cells):
+        """Return (x, y) of the first True cell in row-major order."""
+        ys, xs = np.nonzero(cells)
+        return int(xs[0]), int(ys[0])
+
+    def test_is_land_ocean_position(self, mask_arr):
         """Test querying land positions at known coordinates."""
         mask = load_land_sea_mask()
 
@@ -42,69 +58,32 @@ class TestLandSeaMask:
         assert mask.is_land(0, 0) == False
 
         # Check some positions are classified
-        land_found = False
-        ocean_found = False
-        for y in range(80):
-            for x in range(128):
-                if mask.is_land(x, y):
-                    land_found = True
-                else:
-                    ocean_found = True
-                if land_found and ocean_found:
-                    break
-            if land_found and ocean_found:
-                break
-
-        assert land_found, "No land positions found"
-        assert ocean_found, "No ocean positions found"
-
-    def test_get_part_type_land(self):
+        assert mask_arr.any(), "No land positions found"
+        assert (~mask_arr).any(), "No ocean positions found"
+
+    def test_get_part_type_land(self, mask_arr):
         """Test get_part_type returns 'brick' for land positions."""
         mask = load_land_sea_mask()
+        x, y = self._first_position(mask_arr)
+        assert mask.get_part_type(x, y) == "brick"
 
-        # Find a land position
-        for y in range(80):
-            for x in range(128):
-                if mask.is_land(x, y):
-                    assert mask.get_part_type(x, y) == "brick"
-                    return
-        pytest.fail("No land position found")
-
-    def test_get_part_type_ocean(self):
+    def test_get_part_type_ocean(self, mask_arr):
         """Test get_part_type returns 'tile' for ocean positions."""
         mask = load_land_sea_mask()
+        x, y = self._first_position(~mask_arr)
+        assert mask.get_part_type(x, y) == "tile"
 
-        # Find an ocean position
-        for y in range(80):
-            for x in range(128):
-                if not mask.is_land(x, y):
-                    assert mask.get_part_type(x, y) == "tile"
-                    return
-        pytest.fail("No ocean position found")
-
-    def test_get_lego_part_id_land(self):
+    def test_get_lego_part_id_land(self, mask_arr):
         """Test get_lego_part_id returns '3062b' for land positions."""
         mask = load_land_sea_mask()
+        x, y = self._first_position(mask_arr)
+        assert mask.get_lego_part_id(x, y) == "3062b"
 
-        # Find a land position
-        for y in range(80):
-            for x in range(128):
-                if mask.is_land(x, y):
-                    assert mask.get_lego_part_id(x, y) == "3062b"
-                    return
-        pytest.fail("No land position found")
-
-    def test_get_lego_part_id_ocean(self):
+    def test_get_lego_part_id_ocean(self, mask_arr):
         """Test get_lego_part_id returns '98138' for ocean positions."""
         mask = load_land_sea_mask()
-
-        # Find an ocean position
-        for y in range(80):
-            for x in range(128):
-                if not mask.is_land(x, y):
-                    assert mask.get_lego_part_id(x, y) == "98138"
-                    return
-        pytest.fail("No ocean position found")
+        x, y = self._first_position(~mask_arr)
+        assert mask.get_lego_part_id(x, y) == "98138"
 
     def test_mask_is_cached(self):
         """Test that mask loading uses cache."""
@@ -113,6 +92,44 @@ class TestLandSeaMask:
         # Should return the same cached instance
         assert mask1 is mask2
 
+    def test_as_array_matches_is_land(self):
+        """Test that the array view agrees with is_land and is read-only."""
+        mask = LandSeaMask(
+            width=4, height=3, land_positions={(0, 0), (3, 1), (2, 2)},
+            source="test", extracted_date=""
+        )
+        land = mask.as_array()
+
+        assert land.tolist() == [
+            [True, False, False, False],
+            [False, False, False, True],
+            [False, False, True, False],
+        ]
+        assert mask.is_land(3, 1) and not mask.is_land(1, 2)
+        assert mask.land_count == 3
+        with pytest.raises(ValueError):
+            land[0, 1] = True
+
+    def test_out_of_range_land_positions_rejected(self):
+        """Test that land coordinates outside the grid are rejected."""
+        with pytest.raises(ValueError):
+            LandSeaMask(
+                width=4, height=3, land_positions={(4, 0)},
+                source="test", extracted_date=""
+            )
+
+    def test_mask_ignores_later_changes_to_input(self):
+        """Test that mutating the land position set after construction has no effect."""
+        land_positions = {(0, 0)}
+        mask = LandSeaMask(
+            width=4, height=3, land_positions=land_positions,
+            source="test", extracted_date=""
+        )
+        land_positions.add((1, 1))
+
+        assert not mask.is_land(1, 1)
+        assert mask.land_count == 1
+
     def test_invalid_coordinates(self):
         """Test accessing invalid coordinates raises error."""
         mask = load_land_sea_mask()
@@ -146,15 +163,43 @@ class TestLandSeaMask:
     def test_count_matches_data(self):
         """Test that counted land positions matches reported land_count."""
         mask = load_land_sea_mask()
+        land = mask.as_array()
+
+        assert land.shape == (80, 128)
+        assert mask.count_land() == int(land.sum()) == mask.land_count
+        assert int((~land).sum()) == mask.ocean_count
 
-        counted_land = 0
-        counted_ocean = 0
-        for y in range(80):
-            for x in range(128):
-                if mask.is_land(x, y):
-                    counted_land += 1
-                else:
-                    counted_ocean += 1
-
-        assert counted_land == mask.land_count
-        assert counted_ocean == mask.ocean_count
+    def test_is_land_matches_array_across_word_boundaries(self):
+        """Test that is_land agrees with the array for widths past 64 bits."""
+        land = np.random.default_rng(0).random((3, 70)) < 0.5
+        mask = LandSeaMask.from_array(land, source="test", extracted_date="")
+
+        assert (mask.width, mask.height, mask.source) == (70, 3, "test")
+        assert mask.land_count == int(land.sum())
+        assert [
+            [mask.is_land(x, y) for x in range(70)] for y in range(3)
+        ] == land.tolist()
+
+    def test_packed_mask_roundtrip(self, tmp_path):
+        """Test that a packed bitmap loads back to the same mask."""
+        mask = load_land_sea_mask()
+        bin_path = tmp_path / "mask.bin"
+        save_packed_mask(mask, bin_path)
+
+        assert bin_path.stat().st_size == 80 * 16
+
+        loaded = load_land_sea_mask(str(bin_path))
+        assert loaded.width == 128
+        assert loaded.height == 80
+        assert loaded.land_count == mask.land_count
+        assert (loaded.as_array() == mask.as_array()).all()
+        # Loading another path must not evict the cached default mask
+        assert load_land_sea_mask() is mask
+
+    def test_packed_mask_wrong_size(self, tmp_path):
+        """Test that a truncated packed bitmap is rejected."""
+        bin_path = tmp_path / "truncated.bin"
+        bin_path.write_bytes(b"\x00" * 100)
+
+        with pytest.raises(ValueError):
+            load_land_sea_mask(str(bin_path))
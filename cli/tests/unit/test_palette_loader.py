@@ -1,5 +1,6 @@
 """Unit tests for palette loader."""
 
+import numpy as np
 import pytest
 from pathlib import Path
 
@@ -23,6 +24,14 @@ class TestLegoColor:
         with pytest.raises(AttributeError):
             color.name = "Black"
 
+    def test_rgb_packed(self):
+        """Test that the packed RGB integer is derived from rgb."""
+        color = LegoColor(id=26, name="Black", rgb=(27, 42, 52), hex="#1B2A34")
+        assert color.rgb_packed == (27 << 16) | (42 << 8) | 52
+        assert not hasattr(color, "__dict__")
+        with pytest.raises(AttributeError):
+            color.rgb_packed = 0
+
     def test_from_dict(self):
         """Test creating LegoColor from dictionary."""
         data = {"id": 26, "name": "Black", "rgb": [27, 42, 52], "hex": "#1B2A34"}
@@ -42,6 +51,10 @@ class TestLegoPalette:
         assert len(palette) > 0
         assert all(isinstance(c, LegoColor) for c in palette.colors)
 
+    def test_load_default_is_cached(self):
+        """Test that the default palette is parsed once and shared."""
+        assert LegoPalette.load_default() is LegoPalette.load_default()
+
     def test_palette_contains_basic_colors(self):
         """Test that palette contains basic LEGO colors."""
         palette = LegoPalette.load_default()
@@ -74,6 +87,13 @@ class TestLegoPalette:
         assert palette.get_by_name("white") is not None
         assert palette.get_by_name("White") is not None
 
+    def test_get_by_rgb(self):
+        """Test getting color by exact RGB value."""
+        palette = LegoPalette.load_default()
+        assert palette.get_by_rgb((255, 255, 255)).name == "White"
+        assert palette.get_by_rgb([255, 255, 255]).name == "White"
+        assert palette.get_by_rgb((127, 84, 200)) is None
+
     def test_get_rgb_array(self):
         """Test getting all RGB values as array."""
         palette = LegoPalette.load_default()
@@ -82,6 +102,16 @@ class TestLegoPalette:
         assert all(len(rgb) == 3 for rgb in rgb_array)
         assert all(all(0 <= c <= 255 for c in rgb) for rgb in rgb_array)
 
+    def test_rgb_array_property(self):
+        """Test the contiguous uint8 array of palette RGB values."""
+        palette = LegoPalette.load_default()
+        rgb_array = palette.rgb_array
+        assert rgb_array.shape == (len(palette), 3)
+        assert rgb_array.dtype == np.uint8
+        assert rgb_array.flags.c_contiguous
+        assert not rgb_array.flags.writeable
+        assert [tuple(rgb) for rgb in rgb_array.tolist()] == palette.get_rgb_array()
+
     def test_palette_iteration(self):
         """Test iterating over palette colors."""
         palette = LegoPalette.load_default()
@@ -1,7 +1,8 @@
 """Unit tests for PositionPlacement class."""
 
+import numpy as np
 import pytest
-from lego_image_processor.layout.position import PositionPlacement
+from lego_image_processor.layout.position import PositionPlacement, PositionPlacementArray
 
 
 class TestPositionPlacement:
@@ -206,3 +207,95 @@ class TestPositionPlacement:
             lego_color_code="23", part_type="tile", lego_part_id="98138"
         )
         assert pos1 != pos2
+
+    def test_uses_slots(self):
+        """Test that instances carry no per-instance __dict__."""
+        pos = PositionPlacement(
+            x=0, y=0, color_id="lego_blue", color_name="Blue",
+            lego_color_code="23", part_type="tile", lego_part_id="98138"
+        )
+        assert not hasattr(pos, "__dict__")
+        with pytest.raises(AttributeError):
+            pos.x = 1
+
+    def test_from_dict_interns_strings(self):
+        """Test that equal strings from separate dicts share one object."""
+        def make_data():
+            return {
+                "x": 0, "y": 0,
+                "color_id": "".join(["lego_", "blue"]),
+                "color_name": "".join(["Bl", "ue"]),
+                "lego_color_code": "".join(["2", "3"]),
+                "part_type": "".join(["ti", "le"]),
+                "lego_part_id": "".join(["981", "38"])
+            }
+
+        pos1 = PositionPlacement.from_dict(make_data())
+        pos2 = PositionPlacement.from_dict(make_data())
+        assert pos1.color_id is pos2.color_id
+        assert pos1.color_name is pos2.color_name
+        assert pos1.part_type is pos2.part_type
+
+
+class TestPositionPlacementArray:
+    """Tests for PositionPlacementArray class."""
+
+    COLOR_TABLE = [
+        ("lego_blue", "Blue", "23"),
+        ("lego_green", "Green", "28"),
+    ]
+
+    @pytest.fixture
+    def placements(self):
+        """Create a 3x2 grid with land in the left column."""
+        mask = np.array([[True, False, False], [True, False, False]])
+        colors = np.array([[1, 0, 0], [1, 1, 0]])
+        return PositionPlacementArray.from_mask_and_colors(mask, colors, self.COLOR_TABLE)
+
+    def test_from_mask_and_colors_columns(self, placements):
+        """Test columns are filled in row-major order with compact dtypes."""
+        assert len(placements) == 6
+        assert placements.xs.tolist() == [0, 1, 2, 0, 1, 2]
+        assert placements.ys.tolist() == [0, 0, 0, 1, 1, 1]
+        assert placements.color_idx.tolist() == [1, 0, 0, 1, 1, 0]
+        assert placements.part_type_idx.tolist() == [0, 1, 1, 0, 1, 1]
+        assert placements.xs.dtype == np.int16
+        assert placements.color_idx.dtype == np.uint8
+
+    def test_placement(self, placements):
+        """Test building a single placement from a row."""
+        assert placements.placement(3) == PositionPlacement(
+            x=0, y=1, color_id="lego_green", color_name="Green",
+            lego_color_code="28", part_type="brick", lego_part_id="3062b"
+        )
+
+    def test_iter_placements_matches_placement(self, placements):
+        """Test that iteration yields the same placements as row access."""
+        assert list(placements.iter_placements()) == [
+            placements.placement(i) for i in range(len(placements))
+        ]
+
+    def test_shape_mismatch(self):
+        """Test that mismatched mask and color shapes raise."""
+        with pytest.raises(ValueError, match="does not match"):
+            PositionPlacementArray.from_mask_and_colors(
+                np.zeros((2, 3), dtype=bool), np.zeros((3, 2), dtype=np.uint8), self.COLOR_TABLE
+            )
+
+    def test_color_index_out_of_range(self):
+        """Test that indices past the color table raise instead of wrapping."""
+        with pytest.raises(ValueError, match="Color indices"):
+            PositionPlacementArray.from_mask_and_colors(
+                np.zeros((1, 2), dtype=bool), np.array([[0, -1]]), self.COLOR_TABLE
+            )
+        with pytest.raises(ValueError, match="Color indices"):
+            PositionPlacementArray.from_mask_and_colors(
+                np.zeros((1, 2), dtype=bool), np.array([[0, 2]]), self.COLOR_TABLE
+            )
+
+    def test_color_table_too_large(self):
+        """Test that a color table beyond uint8 indices is rejected."""
+        with pytest.raises(ValueError, match="at most 256"):
+            PositionPlacementArray.from_mask_and_colors(
+                np.zeros((1, 1), dtype=bool), np.array([[0]]), self.COLOR_TABLE * 129
+            )
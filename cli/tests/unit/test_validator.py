@@ -1,8 +1,14 @@
 """Unit tests for LayoutValidator and related classes."""
 
+import math
+import sys
+from datetime import datetime, timezone
+import numpy as np
 import pytest
-from PIL import Image
 
+from lego_image_processor.core import json_codec
+from lego_image_processor.layout.grid import PositionPlacementGrid
+from lego_image_processor.layout.position import PositionPlacementArray
 from lego_image_processor.layout.validator import (
     ColorSuggestion,
     ColorUnavailableViolation,
@@ -10,10 +16,56 @@ from lego_image_processor.layout.validator import (
     ValidationReport,
     LayoutValidator
 )
-from lego_image_processor.layout.kit_spec import load_kit_specification
-from lego_image_processor.layout.generator import LayoutGenerator
-from lego_image_processor.layout.land_sea_mask import load_land_sea_mask
-from lego_image_processor.palette.loader import LegoPalette
+
+
+# Grid size for validator tests that only inspect report shape
+TEST_LAYOUT_SIZE = (8, 8)
+
+
+@pytest.fixture(scope="module")
+def quantity_violation():
+    """Tile quantity violation shared by the module (violations are immutable)."""
+    return QuantityExceededViolation(
+        part_type="tile",
+        part_id="98138",
+        color_id="lego_blue",
+        color_name="Blue",
+        positions_required=2000,
+        kit_quantity=1500,
+        shortfall=500
+    )
+
+
+def _build_layout(palette, land, color_idx, color_names):
+    """Build a layout from a land mask and per-cell indexes into color_names."""
+    color_table = []
+    for name in color_names:
+        color = palette.get_by_name(name)
+        color_table.append((f"lego_{name.lower().replace(' ', '_')}", color.name, str(color.id)))
+
+    height, width = land.shape
+    placements = PositionPlacementArray.from_mask_and_colors(land, color_idx, color_table)
+    return PositionPlacementGrid(
+        width=width, height=height,
+        positions=list(placements.iter_placements()),
+        source_image="test.png"
+    )
+
+
+def _check_is_report(report):
+    """Validation returns a ValidationReport for the kit, regardless of violations."""
+    assert isinstance(report, ValidationReport)
+    assert report.kit_id == "31203"
+
+
+def _check_buildability_score(report):
+    """Validation report has a buildability score in [0, 1]."""
+    assert 0.0 <= report.buildability_score <= 1.0
+
+
+def _check_timestamp(report):
+    """Validation report has a timezone-aware ISO format timestamp."""
+    assert report.validated_at_datetime.tzinfo is not None
 
 
 class TestColorSuggestion:
@@ -74,36 +126,32 @@ class TestColorUnavailableViolation:
         assert data["positions_required"] == 100
         assert "suggested_alternative" in data
 
+    def test_uses_slots_and_is_frozen(self):
+        """Test that violations carry no __dict__ and cannot be modified."""
+        violation = ColorUnavailableViolation(
+            part_type="brick",
+            part_id="3062b",
+            color_id="".join(["lego_", "purple"]),
+            color_name="Purple",
+            positions_required=100
+        )
+        assert not hasattr(violation, "__dict__")
+        assert violation.color_id is sys.intern("lego_purple")
+        with pytest.raises(AttributeError):
+            violation.positions_required = 1
+
 
 class TestQuantityExceededViolation:
     """Tests for QuantityExceededViolation class."""
 
-    def test_create_violation(self):
+    def test_create_violation(self, quantity_violation):
         """Test creating a quantity exceeded violation."""
-        violation = QuantityExceededViolation(
-            part_type="tile",
-            part_id="98138",
-            color_id="lego_blue",
-            color_name="Blue",
-            positions_required=2000,
-            kit_quantity=1500,
-            shortfall=500
-        )
-        assert violation.type == "quantity_exceeded"
-        assert violation.shortfall == 500
+        assert quantity_violation.type == "quantity_exceeded"
+        assert quantity_violation.shortfall == 500
 
-    def test_to_dict(self):
+    def test_to_dict(self, quantity_violation):
         """Test converting violation to dictionary."""
-        violation = QuantityExceededViolation(
-            part_type="tile",
-            part_id="98138",
-            color_id="lego_blue",
-            color_name="Blue",
-            positions_required=2000,
-            kit_quantity=1500,
-            shortfall=500
-        )
-        data = violation.to_dict()
+        data = quantity_violation.to_dict()
         assert data["type"] == "quantity_exceeded"
         assert data["shortfall"] == 500
 
@@ -111,9 +159,10 @@ class TestQuantityExceededViolation:
 class TestValidationReport:
     """Tests for ValidationReport class."""
 
-    def test_create_buildable_report(self):
-        """Test creating a buildable report."""
-        report = ValidationReport(
+    @pytest.fixture
+    def buildable_report(self):
+        """Create a buildable report with no violations."""
+        return ValidationReport(
             buildable=True,
             buildability_score=1.0,
             violations=[],
@@ -121,25 +170,19 @@ class TestValidationReport:
             kit_id="31203",
             layout_file="layout.json"
         )
-        assert report.buildable
-        assert report.buildability_score == 1.0
-        assert len(report.violations) == 0
 
-    def test_create_unbuildable_report(self):
+    def test_create_buildable_report(self, buildable_report):
+        """Test creating a buildable report."""
+        assert buildable_report.buildable
+        assert buildable_report.buildability_score == 1.0
+        assert len(buildable_report.violations) == 0
+
+    def test_create_unbuildable_report(self, quantity_violation):
         """Test creating an unbuildable report."""
-        violation = QuantityExceededViolation(
-            part_type="tile",
-            part_id="98138",
-            color_id="lego_blue",
-            color_name="Blue",
-            positions_required=2000,
-            kit_quantity=1500,
-            shortfall=500
-        )
         report = ValidationReport(
             buildable=False,
             buildability_score=0.75,
-            violations=[violation],
+            violations=[quantity_violation],
             validated_at="2026-01-07T12:00:00Z",
             kit_id="31203",
             layout_file="layout.json"
@@ -147,92 +190,132 @@ class TestValidationReport:
         assert not report.buildable
         assert len(report.violations) == 1
 
-    def test_to_json(self):
-        """Test converting report to JSON."""
-        report = ValidationReport(
-            buildable=True,
-            buildability_score=1.0,
-            violations=[],
-            validated_at="2026-01-07T12:00:00Z",
-            kit_id="31203",
-            layout_file="layout.json"
+    def test_validated_at_parsed(self, buildable_report):
+        """Test that the timestamp is parsed once at construction."""
+        assert buildable_report.validated_at_datetime == datetime(
+            2026, 1, 7, 12, 0, tzinfo=timezone.utc
         )
-        json_str = report.to_json()
-        assert '"buildable": true' in json_str
-        assert '"kit_id": "31203"' in json_str
+
+    def test_invalid_validated_at(self):
+        """Test that a non-ISO timestamp is rejected."""
+        with pytest.raises(ValueError):
+            ValidationReport(
+                buildable=True,
+                buildability_score=1.0,
+                violations=[],
+                validated_at="yesterday",
+                kit_id="31203",
+                layout_file="layout.json"
+            )
+
+    @pytest.fixture
+    def report_json_dict(self, buildable_report):
+        """Parse the JSON of a buildable report once for structured assertions."""
+        return json_codec.loads(buildable_report.to_json())
+
+    def test_to_json(self, report_json_dict):
+        """Test converting report to JSON."""
+        assert report_json_dict["buildable"] is True
+        assert report_json_dict["kit_id"] == "31203"
 
 
 class TestLayoutValidator:
     """Tests for LayoutValidator class."""
 
-    @pytest.fixture
-    def palette(self):
-        """Load the default LEGO palette."""
-        return LegoPalette.load_default()
+    @pytest.fixture(scope="module")
+    def sample_layout(self, palette):
+        """Small White layout with land on the left half, built once per module.
 
-    @pytest.fixture
-    def kit_spec(self):
-        """Load the kit specification."""
-        return load_kit_specification("31203")
+        The report tests only check report shape, so an 8x8 grid built directly
+        stands in for a full 128x80 generated layout.
+        """
+        width, height = TEST_LAYOUT_SIZE
+        land = np.zeros((height, width), dtype=bool)
+        land[:, :width // 2] = True
 
-    @pytest.fixture
-    def validator(self, kit_spec, palette):
-        """Create a LayoutValidator instance."""
-        return LayoutValidator(kit_spec=kit_spec, palette=palette)
+        return _build_layout(
+            palette, land, np.zeros((height, width), dtype=np.uint8), ["White"]
+        )
 
-    @pytest.fixture
-    def generator(self, palette):
-        """Create a LayoutGenerator instance."""
-        land_sea_mask = load_land_sea_mask()
-        return LayoutGenerator(palette=palette, land_sea_mask=land_sea_mask)
+    @pytest.fixture(scope="module")
+    def unbuildable_layout(self, palette):
+        """16x8 layout whose land breaks the kit limits, built once per module.
+
+        The left half is land: 56 Earth Blue bricks (the kit has 50) and a bottom
+        row of 8 Black bricks (not a brick color in the kit). The ocean is White.
+        """
+        land = np.zeros((8, 16), dtype=bool)
+        land[:, :8] = True
+        color_idx = np.zeros((8, 16), dtype=np.uint8)
+        color_idx[:7, :8] = 1
+        color_idx[7, :8] = 2
+
+        return _build_layout(
+            palette, land, color_idx, ["White", "Earth Blue", "Black"]
+        )
+
+    @pytest.fixture(scope="module")
+    def sample_report(self, validator, sample_layout):
+        """Validation report for sample_layout, computed once per module."""
+        return validator.validate(sample_layout, layout_file="test.json")
 
     def test_create_validator(self, kit_spec, palette):
         """Test creating a LayoutValidator."""
         validator = LayoutValidator(kit_spec=kit_spec, palette=palette)
         assert validator is not None
 
-    def test_validate_returns_report(self, validator, generator, palette):
-        """Test that validation returns a ValidationReport."""
-        # Create a simple layout
-        first_color = palette.colors[0]
-        image = Image.new("RGB", (128, 80), first_color.rgb)
-        layout = generator.generate(image, source_filename="test.png")
-
-        report = validator.validate(layout, layout_file="test.json")
-
-        assert isinstance(report, ValidationReport)
-        assert report.kit_id == "31203"
-
-    def test_validate_has_buildability_score(self, validator, generator, palette):
-        """Test that validation report has buildability score."""
-        first_color = palette.colors[0]
-        image = Image.new("RGB", (128, 80), first_color.rgb)
-        layout = generator.generate(image, source_filename="test.png")
-
-        report = validator.validate(layout, layout_file="test.json")
+    @pytest.mark.parametrize(
+        "check",
+        [_check_is_report, _check_buildability_score, _check_timestamp],
+        ids=["is_report", "score_range", "timestamp"]
+    )
+    def test_validate_report_properties(self, sample_report, check):
+        """Test properties of the report returned by validate."""
+        check(sample_report)
+
+    def test_validate_buildable_layout(self, sample_report):
+        """Test that a layout within the kit limits has no violations."""
+        assert sample_report.buildable
+        assert sample_report.buildability_score == 1.0
+        assert sample_report.violations == []
+
+    def test_validate_unbuildable_layout(self, validator, kit_spec, unbuildable_layout):
+        """Test violations, score and suggestions for a layout beyond the kit."""
+        report = validator.validate(unbuildable_layout, layout_file="test.json")
 
-        assert 0.0 <= report.buildability_score <= 1.0
-
-    def test_validate_detects_unavailable_color(self, validator, generator, palette):
-        """Test that validator detects unavailable colors."""
-        # Use a color that might not be in the kit
-        # We'll check if any violations are reported
-        first_color = palette.colors[0]
-        image = Image.new("RGB", (128, 80), first_color.rgb)
-        layout = generator.generate(image, source_filename="test.png")
-
-        report = validator.validate(layout, layout_file="test.json")
-
-        # Report should exist regardless of violations
-        assert isinstance(report, ValidationReport)
-
-    def test_validate_reports_timestamp(self, validator, generator, palette):
-        """Test that validation report has timestamp."""
-        first_color = palette.colors[0]
-        image = Image.new("RGB", (128, 80), first_color.rgb)
-        layout = generator.generate(image, source_filename="test.png")
-
-        report = validator.validate(layout, layout_file="test.json")
-
-        assert report.validated_at is not None
-        assert "T" in report.validated_at  # ISO format
+        assert not report.buildable
+        violations = {violation.type: violation for violation in report.violations}
+        assert set(violations) == {"quantity_exceeded", "color_unavailable"}
+
+        exceeded = violations["quantity_exceeded"]
+        assert exceeded.color_id == "lego_earth_blue"
+        assert (exceeded.positions_required, exceeded.kit_quantity) == (56, 50)
+        assert exceeded.shortfall == 6
+
+        unavailable = violations["color_unavailable"]
+        assert unavailable.color_id == "lego_black"
+        assert unavailable.part_type == "brick"
+        assert unavailable.positions_required == 8
+        assert unavailable.suggested_alternative is not None
+        assert unavailable.suggested_alternative.color_id in kit_spec.available_colors_brick
+
+        # 6 positions short on Earth Blue plus 8 Black bricks, out of 128
+        assert report.buildability_score == pytest.approx((128 - 6 - 8) / 128)
+
+    def test_find_nearest_color_matches_linear_scan(self, validator, kit_spec, palette):
+        """Test that suggestions match a first-minimum scan over kit colors."""
+        available = kit_spec.available_colors_brick
+        for color in palette:
+            target_id = validator._make_color_id(color.name)
+            expected = None
+            for color_id in available:
+                candidate = validator._color_by_id.get(color_id)
+                if candidate is None:
+                    continue
+                distance = math.dist(color.rgb, candidate.rgb)
+                if expected is None or distance < expected[1]:
+                    expected = (color_id, distance)
+
+            suggestion = validator._find_nearest_color(target_id, available)
+            assert suggestion.color_id == expected[0]
+            assert suggestion.color_distance == pytest.approx(expected[1])